@@ -5,17 +5,26 @@ from fca.concept import Concept
 from fca.concept_system import ConceptSystem
 from fca.context import Context, make_random_context
 from fca.concept_lattice import ConceptLattice
+from fca.packed_lattice import PackedConceptLattice
 from fca.mvcontext import ManyValuedContext
 from fca.scale import Scale
-from fca.implication import Implication, UnitImplication, NegativeImplication
+from fca.implication import (Implication, UnitImplication, NegativeImplication,
+                             BitImplication)
+from fca.implication_system import ImplicationSystem
+from fca.implication_index import ImplicationIndex, SetIndex, IndexCache
 
-from fca.algorithms import (norris, compute_covering_relation,
+from fca.algorithms import (norris, lindig, compute_covering_relation,
                             scale_mvcontext, compute_dg_basis, aibasis,
-                            compute_dg_basis_simple, factors)
+                            compute_dg_basis_simple, compute_dg_basis_bits,
+                            compute_dg_basis_parallel, factors,
+                            check_implications, luxenburger_basis,
+                            association_rules, compute_direct_basis,
+                            direct_basis, minimal_generators,
+                            proper_premise_basis)
 from fca.readwrite import (read_txt, read_cxt, write_cxt, write_dot,
                            read_mv_txt, read_xml, write_xml, write_mv_txt,
                            uread_cxt, uwrite_cxt, read_txt_with_names,
-                           read_mv_csv, read_csv)
+                           read_mv_csv, read_csv, write_binary, read_binary)
 from fca.algorithms.filtering import (filter_concepts, compute_estability,
                                       compute_istability,
                                       compute_separation_index, 
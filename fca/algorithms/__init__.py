@@ -2,10 +2,22 @@
 """FCA algorithms"""
 
 from fca.algorithms.norris import *
+from fca.algorithms.lindig import *
+from fca.algorithms.aoc_poset import *
+from fca.algorithms.external_cbo import *
+from fca.algorithms.partition import *
 from fca.algorithms.scaling import *
 from fca.algorithms.filtering import *
-from fca.algorithms.dg_basis import compute_dg_basis, compute_dg_basis_simple, dg_basis_iter_simple
+from fca.algorithms.dg_basis import (compute_dg_basis,
+                                     compute_dg_basis_simple,
+                                     compute_dg_basis_bits,
+                                     compute_dg_basis_parallel,
+                                     dg_basis_iter_simple)
 from fca.algorithms.closure_operators import *
+from fca.algorithms.implication_check import *
+from fca.algorithms.association import *
+from fca.algorithms.direct_basis import *
+from fca.algorithms.generators import *
 from fca.algorithms.factors import *
 from fca.algorithms.aibasis import *
 from fca.algorithms.exploration import *
@@ -7,18 +7,33 @@ Attribute Incremental algorithm for finding the canonical basis.
 import fca
 
 from fca.algorithms import closure_operators
+from fca.bitsets import set2bits, bits2set, iter_bits, full_mask
+from fca.implication_index import ImplicationIndex
 
 def kclosure(s, k, cxt):
     """
     Return the closure of s in cxt restricted to the first k attributes.
     """
-    closure = set(cxt.attributes[:k])
-    for o in cxt.examples():
-        if s == closure:
-            break
-        if s <= o:
-            closure &= o
-    return closure
+    closed = column_closure(set2bits(s, cxt.attribute_indices),
+                            cxt.attribute_bits[:k],
+                            full_mask(len(cxt.objects)))
+    return bits2set(closed, cxt.attributes)
+
+
+def column_closure(bits, columns, all_objects):
+    """
+    Return the closure of the set of attributes given by bitset *bits*
+    in the context given by attribute extents *columns* (bitsets over
+    objects, *all_objects* is the bitset of all objects).
+    """
+    extent = all_objects
+    for j in iter_bits(bits):
+        extent &= columns[j]
+    closed = 0
+    for j, column in enumerate(columns):
+        if column & extent == extent:
+            closed |= 1 << j
+    return closed
 
 
 def compare_tuples(p, r):
@@ -33,23 +48,98 @@ def compare_tuples(p, r):
 
 
 def compute_canonical_basis(cxt, close=closure_operators.simple_closure):
-    preclosed = [(set(cxt.objects), set())]
-    basis = []
-    # each preclosed is (extent, intent) or (extent, premise, implication)
-    # assuming that premise and implication.premise are the same object
-    for i in range(len(cxt.attributes)):
-        preclosed, basis = update_preclosed(i, cxt, preclosed, close)
-    return basis
+    basis = IncrementalBasis(cxt.objects, close)
+    for m, extent in zip(cxt.attributes, cxt.attribute_bits):
+        basis.add_attribute_bits(extent, m)
+    return basis.implications
 
 
-def update_preclosed(i, cxt, preclosed, close):
+class IncrementalBasis(object):
+    """Canonical basis of a context whose attributes are added one by one
+
+    Keeps the list of preclosed sets of the attribute incremental
+    algorithm, so the canonical basis is updated when a new attribute (a
+    column of the context) appears instead of being recomputed. Attribute
+    extents are stored as bitsets over objects and closures in the
+    context are computed on these columns.
+
+    Examples
+    ========
 
+    >>> ib = IncrementalBasis([1, 2, 3])
+    >>> ib.add_attribute({1, 2}, 'a')
+    >>> ib.add_attribute({2, 3}, 'b')
+    >>> ib.implications
+    []
+    >>> ib.add_attribute({2}, 'c')
+    >>> sorted(str(imp) for imp in ib.implications)
+    ['a, b => c', 'c => a, b']
+
+    """
+    def __init__(self, objects, close=closure_operators.simple_closure):
+        self._objects = list(objects)
+        self._object_indices = dict((g, i)
+                                    for i, g in enumerate(self._objects))
+        self._all_objects = full_mask(len(self._objects))
+        self._close = close
+        self._attributes = []
+        self._attribute_indices = {}
+        self._columns = []
+        # each preclosed is (extent, intent) or (extent, premise, implication)
+        # assuming that premise and implication.premise are the same object;
+        # extents are bitsets over objects
+        self._preclosed = [(self._all_objects, set())]
+        self._basis = []
+
+    def get_attributes(self):
+        return self._attributes
+
+    attributes = property(get_attributes)
+
+    def get_implications(self):
+        """Return copies of implications of the current canonical basis"""
+        return [fca.Implication(imp.get_premise(), imp.get_conclusion())
+                for imp in self._basis]
+
+    implications = property(get_implications)
+
+    def add_attribute(self, extent, name):
+        """Add attribute *name* having objects *extent*, update the basis"""
+        self.add_attribute_bits(set2bits(extent, self._object_indices), name)
+
+    def add_attribute_bits(self, extent, name):
+        """
+        Add attribute *name* whose extent is given by a bitset over object
+        indices, update the basis.
+        """
+        if name in self._attribute_indices:
+            raise ValueError("Attribute {0} already exists".format(name))
+        self._attribute_indices[name] = len(self._attributes)
+        self._attributes.append(name)
+        self._columns.append(extent)
+        self._preclosed, self._basis = _update_preclosed(
+            name, extent, self.kclosure, self._preclosed, self._close)
+
+    def kclosure(self, s):
+        """Return the closure of attribute set *s* in the current context"""
+        closed = column_closure(set2bits(s, self._attribute_indices),
+                                self._columns, self._all_objects)
+        return bits2set(closed, self._attributes)
+
+
+def update_preclosed(i, cxt, preclosed, close):
     m = cxt.attributes[i]
     extent = cxt.get_attribute_extent_by_index(i)
     context_closure = lambda s: kclosure(s, i + 1, cxt)
+    return _update_preclosed(m, extent, context_closure, preclosed, close)
+
+
+def _update_preclosed(m, extent, context_closure, preclosed, close):
+    # extents are either sets of objects or bitsets over objects
 
     old_stable_impl = []    # stores implications
     new_stable_impl = []    # stores implications
+    new_stable_index = ImplicationIndex()
     min_mod_impl = []       # stores implications
     
     non_min_mod = []        # stores triples
@@ -58,7 +148,7 @@ def update_preclosed(i, cxt, preclosed, close):
     new_preclosed = []
 
     for p in preclosed:
-        if p[0] <= extent:  # p[1] -> m holds
+        if p[0] & extent == p[0]:  # p[1] -> m holds
             if is_concept(p):
                 process_modified_concept(p, m, min_mod_impl, mod_extra,
                                          new_preclosed)
@@ -71,7 +161,8 @@ def update_preclosed(i, cxt, preclosed, close):
             if is_concept(p):       # p[1] remains closed
                 process_stable_concept(p, m, extent, new_stable_impl,
                                        new_preclosed,
-                                       context_closure)
+                                       context_closure,
+                                       new_stable_index)
             else:                   # p[1] remains pseudo-closed
                 old_stable_impl.append(p[2])
 
@@ -93,21 +184,25 @@ def update_preclosed(i, cxt, preclosed, close):
 
 
 def process_stable_concept(p, m, extent, new_stable_impl, new_preclosed,
-                           closure):
+                           closure, new_stable_index=None):
     # p is of the form (extent, intent)
+    # new_stable_index, if given, is an ImplicationIndex of new_stable_impl
     new_extent = p[0] & extent
     new_premise = p[1].copy()
     new_premise.add(m)
-    for i in new_stable_impl:
-        if not i.is_respected(new_premise):
-            break
+    if new_stable_index is not None:
+        respected = new_stable_index.respects(new_premise)
     else:
+        respected = all(i.is_respected(new_premise) for i in new_stable_impl)
+    if respected:
         new_conclusion = closure(new_premise)
         if new_conclusion == new_premise:
             new_preclosed.append((new_extent, new_premise))
         else:
             impl = fca.Implication(new_premise, new_conclusion)
             new_stable_impl.append(impl)
+            if new_stable_index is not None:
+                new_stable_index.add(impl)
             new_preclosed.append((new_extent, impl.premise, impl))
 
 def process_modified_implication(p, m, min_mod_impl, non_min_mod,
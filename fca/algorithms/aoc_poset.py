@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""Holds a function that builds the AOC-poset of a context"""
+
+import numpy as np
+
+from fca import Concept, ConceptSystem
+
+
+def aoc_poset(context, block_size=1024):
+    """Build the AOC-poset (Galois sub-hierarchy) of a context
+
+    The AOC-poset consists of object concepts (g'', g') and attribute
+    concepts (m', m'') only, hence it has at most |G| + |M| elements while
+    the full lattice can be exponential in size. Derivations are computed
+    with matrix products over blocks of *block_size* rows of the cross
+    table, so memory stays bounded by block_size * max(|G|, |M|).
+
+    Returns the ConceptSystem instance with its covering relation computed.
+
+    Examples
+    ========
+
+    >>> from fca import Context
+    >>> ct = [[True, False, False, True],\
+              [True, False, True, False],\
+              [False, True, True, False],\
+              [False, True, True, True]]
+    >>> objs = [1, 2, 3, 4]
+    >>> attrs = ['a', 'b', 'c', 'd']
+    >>> c = Context(ct, objs, attrs)
+    >>> cs = aoc_poset(c)
+    >>> len(cs)
+    7
+    >>> print(cs.parents(Concept([3, 4], ['b', 'c'])))
+    {([2, 3, 4], ['c'])}
+
+    """
+    table = context._shaped_table().astype(np.float64)
+    concepts = []
+    found = set()
+    for i, extent in enumerate(_iter_closures(table, block_size)):
+        key = extent.tobytes()
+        if key not in found:
+            found.add(key)
+            concepts.append(Concept(
+                [context.objects[j] for j in np.nonzero(extent)[0]],
+                [context.attributes[j] for j in np.nonzero(table[i])[0]]))
+    for j, intent in enumerate(_iter_closures(table.T, block_size)):
+        extent = table[:, j].astype(bool)
+        key = extent.tobytes()
+        if key not in found:
+            found.add(key)
+            concepts.append(Concept(
+                [context.objects[i] for i in np.nonzero(extent)[0]],
+                [context.attributes[i] for i in np.nonzero(intent)[0]]))
+
+    cs = ConceptSystem(concepts)
+    cs._parents = cs.compute_covering_relation()
+    return cs
+
+
+def _iter_closures(table, block_size):
+    """
+    Generator. For every row of *table* yield the boolean array of rows
+    containing it, i.e. the closure of the row seen as a set of columns.
+    """
+    sizes = table.sum(axis=1)
+    for start in range(0, len(table), block_size):
+        common = table[start:start + block_size].dot(table.T)
+        for row in common == sizes[start:start + block_size, None]:
+            yield row
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+"""
+Holds functions that generate association rules from a concept lattice
+"""
+from fca.implication import Implication
+
+
+def luxenburger_basis(lattice, min_support=0.0, min_conf=0.0):
+    """Generate the Luxenburger basis of partial implications
+
+    For every edge of the covering relation, i.e. for every concept C with
+    an upper neighbour D, the rule int(D) => int(C) is generated. Its
+    support is |ext(C)| / |G| and its confidence is |ext(C)| / |ext(D)|,
+    so the context is not scanned. Only rules with support at least
+    *min_support* and confidence at least *min_conf* are generated.
+
+    *lattice* is a ConceptLattice or a PackedConceptLattice, possibly with
+    infrequent concepts left out.
+
+    Returns an iterator over triples (implication, support, confidence).
+
+    Examples
+    ========
+
+    >>> from fca import Context, ConceptLattice
+    >>> ct = [[True, False, False, True],\
+              [True, False, True, False],\
+              [False, True, True, False],\
+              [False, True, True, True]]
+    >>> c = Context(ct, ['1', '2', '3', '4'], ['a', 'b', 'c', 'd'])
+    >>> cl = ConceptLattice(c)
+    >>> for imp, support, conf in luxenburger_basis(cl, 0.5, 0.6):
+    ...     print(imp, support, round(conf, 2))
+    c => b 0.5 0.67
+     => c 0.75 0.75
+    >>> len(list(luxenburger_basis(cl, min_support=0.5)))
+    4
+
+    """
+    sizes, num_objs = _sizes(lattice)
+    for i in range(len(lattice)):
+        support = sizes[i] / num_objs
+        if support < min_support:
+            continue
+        for j in lattice.parent_ids(i):
+            confidence = sizes[i] / sizes[j]
+            if confidence >= min_conf:
+                yield (_make_rule(lattice, j, i), support, confidence)
+
+
+def association_rules(lattice, min_support=0.0, min_conf=0.0):
+    """Generate partial implications between all comparable concepts
+
+    For every concept C and every concept D strictly above it the rule
+    int(D) => int(C) with support |ext(C)| / |G| and confidence
+    |ext(C)| / |ext(D)| is generated if they are at least *min_support*
+    and *min_conf* respectively. Since confidence decreases when going
+    up, the search from C along the covering relation stops at concepts
+    where confidence falls below *min_conf*.
+
+    Exact rules (confidence 1) are given by the Duquenne-Guigues basis
+    instead.
+
+    Returns an iterator over triples (implication, support, confidence).
+    """
+    sizes, num_objs = _sizes(lattice)
+    for i in range(len(lattice)):
+        support = sizes[i] / num_objs
+        if support < min_support:
+            continue
+        visited = set()
+        stack = list(lattice.parent_ids(i))
+        while stack:
+            j = stack.pop()
+            if j in visited:
+                continue
+            visited.add(j)
+            confidence = sizes[i] / sizes[j]
+            if confidence >= min_conf:
+                yield (_make_rule(lattice, j, i), support, confidence)
+                stack.extend(lattice.parent_ids(j))
+
+
+def _sizes(lattice):
+    sizes = [int(size) for size in lattice.extent_sizes()]
+    return sizes, float(max(len(lattice.context.objects), 1))
+
+
+def _make_rule(lattice, premise_id, conclusion_id):
+    return Implication(lattice[premise_id].intent,
+                       lattice[conclusion_id].intent)
@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+"""
+Holds functions that save and load states of long-running algorithms
+"""
+import os
+import pickle
+
+
+def save_checkpoint(path, kind, state):
+    """
+    Save *state* (a dictionary) of an algorithm identified by *kind* to
+    file *path*. The file is replaced atomically, so an interrupted write
+    leaves the previous checkpoint intact.
+    """
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        pickle.dump({'kind': kind, 'state': state}, f,
+                    pickle.HIGHEST_PROTOCOL)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def load_checkpoint(path, kind):
+    """
+    Return the state saved to file *path* by save_checkpoint. Raise
+    ValueError if the checkpoint was written by another algorithm.
+    """
+    with open(path, 'rb') as f:
+        checkpoint = pickle.load(f)
+    if checkpoint['kind'] != kind:
+        raise ValueError("{0} is a checkpoint of {1}, not of {2}".format(
+            path, checkpoint['kind'], kind))
+    return checkpoint['state']
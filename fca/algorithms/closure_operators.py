@@ -1,9 +1,10 @@
 # -*- coding: utf-8 -*-
 """Derivation and closure operators"""
 
-from collections import defaultdict
 import copy
-from functools import reduce
+
+from fca.implication import BitImplication
+from fca.implication_system import ImplicationSystem
 
 def oprime(objects, context):
     """
@@ -75,24 +76,24 @@ def simple_closure(s, implications):
     new_closure = s.copy()
     changed = True
     while changed:
-        to_remove = set()
+        still_unused = []
         changed = False
         for imp in unused_imps:
             if imp._premise <= new_closure:
                 new_closure |= imp._conclusion
                 changed = True
-                to_remove.add(imp)
-        unused_imps = [imp for imp in unused_imps if not imp in to_remove]
+            else:
+                still_unused.append(imp)
+        unused_imps = still_unused
     return new_closure
     
 def lin_closure(s, implications):
     """
     Input:  A collection of implications and an attribute set s
     Output: The closure of s with respect to implications
-    NB: This implementation is not linear-time.
-        Use lists instead of dicts to get a liner-time implementation.
-        
-    @note: refactored by Artem Revenko to increase performance.
+    NB: implications are compiled into an ImplicationSystem on every
+        call. To close many sets under the same implications build the
+        ImplicationSystem once and use its closure method.
     
     Examples
     ========
@@ -123,39 +124,96 @@ def lin_closure(s, implications):
     True
     
     """
-    def decrease_count(i):
-        imp = current_imps[i]
-        if count[imp] == 0:
-            return set()
-        count[imp] -= 1
-        if count[imp] == 0:
-            return imp._conclusion
-        return set()
-    
     if not implications:
         return s
-    new_closure = s.copy()
-    new_closure = reduce(set.union,
-                         [imp._conclusion for imp in implications if not imp.premise],
-                         new_closure)
-    count_ls = [(imp, len(imp.premise)) for imp in implications]
-    count = dict(count_ls)
-    imps_ls = [(attr, imp) for imp in implications for attr in imp.premise]
-    imps = defaultdict(list)
-    for n,v in imps_ls:
-        imps[n].append(v)
-    update = list(new_closure)
-    
-    while update:
-        m = update.pop()
-        current_imps = imps[m]
-        add = reduce(set.union,
-                     list(map(decrease_count, list(range(len(current_imps))))),
-                     set()) - new_closure
-        new_closure |= add
-        update.extend(add)
-        
-    return new_closure
+    return ImplicationSystem(implications).closure(s)
+
+
+def implications_to_bits(implications, attribute_indices):
+    """
+    Return the list of BitImplications equal to *implications* over
+    attributes numbered by *attribute_indices*.
+    """
+    attributes = sorted(attribute_indices, key=attribute_indices.get)
+    return [BitImplication.from_implication(imp, attributes,
+                                            attribute_indices)
+            for imp in implications]
+
+
+def bits_closure(bits, implications):
+    """
+    Return the closure of bitset *bits* with respect to BitImplications
+    *implications*.
+
+    Examples
+    ========
+
+    >>> from fca.implication import Implication
+    >>> indices = {'a': 0, 'b': 1, 'c': 2}
+    >>> imps = implications_to_bits([Implication({'a'}, {'b'}),
+    ...                              Implication({'b', 'c'}, {'c'})], indices)
+    >>> bits_closure(0b001, imps)
+    3
+    >>> bits_closure(0b101, imps + [BitImplication(0b011, 0b100, 'abc')])
+    7
+    """
+    unused_imps = implications
+    changed = True
+    while changed:
+        changed = False
+        rest = []
+        for imp in unused_imps:
+            premise = imp.premise_bits
+            if premise & bits == premise:
+                if imp.conclusion_bits & ~bits:
+                    bits |= imp.conclusion_bits
+                    changed = True
+            else:
+                rest.append(imp)
+        unused_imps = rest
+    return bits
+
+
+def direct_closure(s, implications):
+    """
+    Return the closure of *s* with respect to a direct basis
+    *implications*: conclusions of all implications whose premises are
+    contained in *s* are added in a single scan, without iterating to a
+    fixpoint. For a basis that is not direct the result can be smaller
+    than the closure.
+
+    Examples
+    ========
+
+    >>> from fca.implication import Implication
+    >>> imps = [Implication({'a'}, {'b'}), Implication({'b'}, {'c'}),
+    ...         Implication({'a'}, {'c'})]
+    >>> direct_closure({'a'}, imps) == {'a', 'b', 'c'}
+    True
+    """
+    closed = set(s)
+    for imp in implications:
+        if imp.get_premise() <= s:
+            closed |= imp.get_conclusion()
+    return closed
+
+
+def bits_direct_closure(bits, implications):
+    """
+    Return the closure of bitset *bits* with respect to a direct basis
+    *implications* given as BitImplications.
+
+    >>> imps = [BitImplication(0b001, 0b010, 'abc'),
+    ...         BitImplication(0b001, 0b100, 'abc')]
+    >>> bits_direct_closure(0b001, imps)
+    7
+    """
+    closed = bits
+    for imp in implications:
+        premise = imp.premise_bits
+        if premise & bits == premise:
+            closed |= imp.conclusion_bits
+    return closed
 
 
 def closure(current, base_set, implications, prefLen):
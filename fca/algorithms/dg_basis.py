@@ -3,9 +3,13 @@
 Holds a function that computes Duquenne-Guigues basis for a given context 
 """
 import copy
+import multiprocessing
 
 from . import closure_operators
-from fca.implication import Implication
+from fca.implication import Implication, BitImplication
+from fca.implication_system import ImplicationSystem
+from fca.bitsets import bits2set, full_mask, popcount
+from fca.algorithms.checkpoint import save_checkpoint, load_checkpoint
 import fca
 
 def compute_dg_basis(cxt,
@@ -95,37 +99,266 @@ def generalized_compute_dg_basis(attributes,
 
     return relative_basis
 
+def compute_dg_basis_bits(cxt, imp_basis=[], cond=lambda x: True):
+    """
+    Compute Duquenne-Guigues basis for a given *cxt* using optimized
+    Ganter algorithm on bitsets over attribute indices.
+
+    The result is the same as that of compute_dg_basis. Prefixes of the
+    attribute list are bit masks, closures in *cxt* are computed with
+    Context.aclosure_bits and found implications are added to one
+    ImplicationSystem together with *imp_basis*, so no implication list
+    is rebuilt for a closure.
+
+    Examples
+    ========
+
+    >>> ct = [[True, False, False, True],\
+              [True, False, True, False],\
+              [False, True, True, False],\
+              [False, True, True, True]]
+    >>> cxt = fca.Context(ct, ['1', '2', '3', '4'], ['a', 'b', 'c', 'd'])
+    >>> compute_dg_basis_bits(cxt) == compute_dg_basis(cxt)
+    True
+
+    """
+    attributes = cxt.attributes
+    full = full_mask(len(attributes))
+    imps = ImplicationSystem(imp_basis, attributes)
+    relative_basis = []
+
+    a = imps.close(0)
+    i = len(attributes)
+
+    while a != full:
+        a_closed = cxt.aclosure_bits(a)
+        if a != a_closed:
+            premise = bits2set(a, attributes)
+            if cond(premise):
+                relative_basis.append(
+                    Implication(premise, bits2set(a_closed, attributes)))
+                imps.add_bits(a, a_closed)
+        if (a_closed & ~a) & full_mask(i):
+            a &= full_mask(i)
+        else:
+            if a_closed == full:
+                return relative_basis
+            a = a_closed
+            i = len(attributes)
+        for j in range(i - 1, -1, -1):
+            m = 1 << j
+            if a & m:
+                a &= ~m
+            else:
+                b = imps.close(a | m)
+                if not (b & ~a) & full_mask(j):
+                    a = b
+                    i = j
+                    break
+
+    return relative_basis
+
+def compute_dg_basis_parallel(cxt, imp_basis=[], processes=None,
+                              chunk_size=256, cond=lambda x: True):
+    """
+    Compute Duquenne-Guigues basis for a given *cxt* level by level.
+
+    Candidate premises are processed in order of increasing size. An
+    implication whose premise has k attributes cannot change the closure
+    of another set of size k, so all candidates of one size are checked
+    independently. Their closures under the implications found so far are
+    computed at once in the current process by ImplicationSystem.close_many;
+    the system is extended by the implications of every level and never
+    rebuilt. Closures in *cxt* of candidates closed under the implications,
+    which take a pass over all objects, are split into chunks of
+    *chunk_size* sets and computed by a multiprocessing.Pool of *processes*
+    workers (by default in the current process). Workers receive the
+    context once, when the pool is started, and then only candidates. Each
+    candidate closed under the implications either is an intent or yields
+    a new implication; sets one attribute larger than its closure become
+    candidates of later levels.
+
+    The result is the same as that of compute_dg_basis. As there,
+    implications whose premises do not satisfy *cond* are neither returned
+    nor used to close other sets; *cond* is called in the current process.
+    Since pseudo-intents are visited in another order, the results agree
+    for any *cond* that rejects all supersets of a rejected premise, but
+    may differ for other conditions.
+
+    Examples
+    ========
+
+    >>> ct = [[True, False, False, True],\
+              [True, False, True, False],\
+              [False, True, True, False],\
+              [False, True, True, True]]
+    >>> cxt = fca.Context(ct, ['1', '2', '3', '4'], ['a', 'b', 'c', 'd'])
+    >>> compute_dg_basis_parallel(cxt) == compute_dg_basis(cxt)
+    True
+    >>> without_a = lambda premise: 'a' not in premise
+    >>> (compute_dg_basis_parallel(cxt, cond=without_a) ==
+    ...  compute_dg_basis(cxt, cond=without_a))
+    True
+
+    """
+    object_bits = cxt.object_bits
+    full = full_mask(len(cxt.attributes))
+    if processes:
+        with multiprocessing.Pool(processes, _init_worker,
+                                  (object_bits, full)) as pool:
+            return _dg_basis_levels(cxt, imp_basis, chunk_size, cond,
+                                    lambda chunks: pool.map(_check_candidates,
+                                                            chunks))
+    return _dg_basis_levels(cxt, imp_basis, chunk_size, cond,
+                            lambda chunks: [_context_closures(object_bits,
+                                                              full, chunk)
+                                            for chunk in chunks])
+
+
+def _dg_basis_levels(cxt, imp_basis, chunk_size, cond, map_closures):
+    """
+    Level-wise part of compute_dg_basis_parallel; *map_closures* takes a
+    list of chunks of candidates and returns the lists of their closures
+    in *cxt*.
+    """
+    attributes = cxt.attributes
+    n = len(attributes)
+    system = ImplicationSystem(imp_basis, attributes)
+    found = []
+
+    candidates = [set() for _ in range(n + 1)]
+    candidates[0].add(0)
+    for k in range(n + 1):
+        level = sorted(candidates[k])
+        if not level:
+            continue
+        closed = []
+        for c, c_imp_closed in zip(level, system.close_many(level)):
+            if c_imp_closed != c:
+                candidates[popcount(c_imp_closed)].add(c_imp_closed)
+            else:
+                closed.append(c)
+        chunks = [closed[j:j + chunk_size]
+                  for j in range(0, len(closed), chunk_size)]
+        new = []
+        for chunk, closures in zip(chunks, map_closures(chunks)):
+            for c, c_closed in zip(chunk, closures):
+                if c_closed != c and cond(bits2set(c, attributes)):
+                    new.append(BitImplication(c, c_closed, attributes))
+                for j in range(n):
+                    if not c_closed >> j & 1:
+                        candidates[popcount(c_closed) + 1].add(
+                            c_closed | 1 << j)
+        for imp in new:
+            system.add_bits(imp.premise_bits, imp.conclusion_bits)
+        found.extend(new)
+
+    found.sort(key=lambda imp: _lectic_key(imp.premise_bits, n))
+    return [Implication(bits2set(imp.premise_bits, attributes),
+                        bits2set(imp.premise_bits | imp.conclusion_bits,
+                                 attributes))
+            for imp in found]
+
+
+# context of a worker process of compute_dg_basis_parallel
+_worker_context = None
+
+
+def _init_worker(object_bits, full):
+    global _worker_context
+    _worker_context = (object_bits, full)
+
+
+def _check_candidates(chunk):
+    """Return closures of candidates from *chunk* in the worker context"""
+    object_bits, full = _worker_context
+    return _context_closures(object_bits, full, chunk)
+
+
+def _context_closures(object_bits, full, chunk):
+    """
+    Return the list of closures of bitsets from *chunk* in the context
+    with object intents *object_bits*.
+    """
+    closures = []
+    for c in chunk:
+        c_closed = full
+        for row in object_bits:
+            if row & c == c:
+                c_closed &= row
+        closures.append(c_closed)
+    return closures
+
+
+def _lectic_key(bits, n):
+    # the first attribute is the most significant one
+    return [bits >> j & 1 for j in range(n)]
+
 ########################################
 def dg_basis_iter_simple(cxt,
                          close=closure_operators.simple_closure,
                          imp_basis=[],
-                         cond=lambda x: True):
+                         cond=lambda x: True,
+                         checkpoint=None,
+                         checkpoint_every=1000,
+                         resume_from=None):
     """
     Compute iterator over Duquenne-Guigues basis for a given *cxt* using 
     optimized Ganter algorithm and simple closure.
+
+    See generalized_dg_basis_iter for *checkpoint*, *checkpoint_every* and
+    *resume_from*.
     """
     aclose = lambda attributes: closure_operators.aclosure(attributes, cxt)
     return generalized_dg_basis_iter(cxt.attributes, 
                                      aclose,
                                      close=close,
                                      imp_basis=imp_basis,
-                                     cond=cond)
+                                     cond=cond,
+                                     checkpoint=checkpoint,
+                                     checkpoint_every=checkpoint_every,
+                                     resume_from=resume_from)
 
 def generalized_dg_basis_iter(attributes,
                               aclose,
                               close=closure_operators.simple_closure,
                               imp_basis=[],
-                              cond=lambda x: True):
+                              cond=lambda x: True,
+                              checkpoint=None,
+                              checkpoint_every=1000,
+                              resume_from=None):
     """Compute iterator over Duquenne-Guigues basis using optimized Ganter's
     algorithm.
     
     *aclose* is a closure operator on the set of attributes.
+
+    If *checkpoint* is a file name, the state of the algorithm (the current
+    set, its index, implications found so far and the number of steps) is
+    saved to it every *checkpoint_every* steps and when the enumeration is
+    over. Given such a file as *resume_from*, the iterator first yields
+    the saved implications and then continues from the saved state; other
+    arguments must be the same as in the interrupted run.
     """    
-    relative_basis = []
-    a = close(set(), imp_basis)
-    i = len(attributes)
+    if resume_from is not None:
+        state = load_checkpoint(resume_from, 'dg_basis')
+        relative_basis = state['basis']
+        a = state['a']
+        i = state['i']
+        step = state['step']
+        for imp in relative_basis:
+            yield imp
+    else:
+        relative_basis = []
+        a = close(set(), imp_basis)
+        i = len(attributes)
+        step = 0
     
     while len(a) < len(attributes):
+        if checkpoint is not None and step % checkpoint_every == 0:
+            save_checkpoint(checkpoint, 'dg_basis',
+                            {'a': a, 'i': i, 'basis': relative_basis,
+                             'step': step})
+        step += 1
         a_closed = set(aclose(a))
         if a != a_closed and cond(a):
             basis_imp = Implication(a.copy(), a_closed.copy())
@@ -149,6 +382,11 @@ def generalized_dg_basis_iter(attributes,
                     i = j
                     break
 
+    if checkpoint is not None:
+        save_checkpoint(checkpoint, 'dg_basis',
+                        {'a': set(attributes), 'i': len(attributes),
+                         'basis': relative_basis, 'step': step})
+
 
 ########################################
 if __name__ == "__main__":    
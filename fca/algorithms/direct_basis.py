@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+"""
+Holds functions that compute the canonical direct basis of implications
+"""
+from fca.implication import Implication
+from fca.bitsets import set2bits, bits2set, iter_bits, popcount
+from fca.algorithms.dg_basis import compute_dg_basis_bits
+
+
+def compute_direct_basis(cxt):
+    """
+    Compute the canonical direct basis of implications of a given *cxt*
+    from its Duquenne-Guigues basis. See direct_basis.
+    """
+    return direct_basis(compute_dg_basis_bits(cxt), cxt.attributes)
+
+
+def direct_basis(implications, attributes=None):
+    """Compute the canonical direct basis equivalent to *implications*
+
+    A basis is direct if the closure of any set is obtained by adding the
+    conclusions of implications whose premises are contained in the set
+    in one pass (see closure_operators.direct_closure). The canonical
+    direct basis consists of implications P => P | {m: P is a minimal set
+    whose closure contains m and P does not}, grouped by premise.
+
+    Implications are split into unit implications over attribute bitsets
+    and saturated with the overlap rule: A => b and C => d with b in C
+    give A | C - {b} => d. For every attribute only minimal premises are
+    kept, which is enough to make the result direct (Bertet and
+    Monjardet). The basis can be exponentially larger than *implications*,
+    it is meant to be computed offline.
+
+    *attributes* fixes the attribute order, by default attributes are
+    taken in order of appearance. Implications are returned ordered by
+    premise size.
+
+    Examples
+    ========
+
+    >>> from fca.algorithms.closure_operators import direct_closure
+    >>> imps = [Implication({'a'}, {'b'}), Implication({'b', 'c'}, {'d'})]
+    >>> for imp in direct_basis(imps):
+    ...     print(imp)
+    a => b
+    a, c => d
+    b, c => d
+    >>> direct_closure({'a', 'c'}, direct_basis(imps)) == {'a', 'b', 'c', 'd'}
+    True
+
+    """
+    implications = list(implications)
+    if attributes is None:
+        attributes = []
+        seen = set()
+        for imp in implications:
+            for m in list(imp.get_premise()) + list(imp.get_conclusion()):
+                if m not in seen:
+                    seen.add(m)
+                    attributes.append(m)
+    indices = dict((m, i) for i, m in enumerate(attributes))
+    units = []
+    for imp in implications:
+        premise = set2bits(imp.get_premise(), indices)
+        conclusion = set2bits(imp.get_conclusion(), indices)
+        units.extend((premise, b) for b in iter_bits(conclusion & ~premise))
+    premises = _saturate(units, len(attributes))
+
+    conclusions = {}
+    for b, ps in enumerate(premises):
+        for premise in ps:
+            conclusions[premise] = conclusions.get(premise, premise) | 1 << b
+    return [Implication(bits2set(premise, attributes),
+                        bits2set(conclusions[premise], attributes))
+            for premise in sorted(conclusions, key=lambda p: (popcount(p), p))]
+
+
+def _saturate(units, n):
+    """
+    Return the list of minimal premises of every attribute derived from
+    unit implications *units* (pairs (premise bitset, attribute index)).
+    """
+    premises = [[] for _ in range(n)]
+    queue = []
+
+    def add(premise, b):
+        if premise >> b & 1:
+            return
+        for p in premises[b]:
+            if p & premise == p:
+                return
+        premises[b] = [p for p in premises[b] if p & premise != premise]
+        premises[b].append(premise)
+        queue.append((premise, b))
+
+    for premise, b in units:
+        add(premise, b)
+    while queue:
+        premise, b = queue.pop()
+        if premise not in premises[b]:
+            # superseded by a smaller premise, whose consequences are
+            # stronger
+            continue
+        bit = 1 << b
+        # premise => b followed by c => d with b in c
+        for d in range(n):
+            for c in premises[d][:]:
+                if c & bit:
+                    add(premise | (c & ~bit), d)
+        # e => x followed by premise => b with x in premise
+        for x in iter_bits(premise):
+            for e in premises[x][:]:
+                add(e | (premise & ~(1 << x)), b)
+    return premises
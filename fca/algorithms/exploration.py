@@ -51,6 +51,8 @@ class BasicExploration(object):
     object_implications = None
     confirmed_attribute_implications = None
     confirmed_object_implications = None
+    _attribute_index = None
+    _object_index = None
     
     def __init__(self, initial_cxt):
         """Exploration starts with some initial context - *initial_cxt*"""
@@ -88,23 +90,21 @@ class BasicExploration(object):
         self.object_implications = transposed_cxt.get_attribute_canonical_basis()
         self.confirmed_attribute_implications = []
         self.confirmed_object_implications = []
+        self._attribute_index = fca.IndexCache(fca.ImplicationIndex)
+        self._object_index = fca.IndexCache(fca.ImplicationIndex)
         
     def recompute_basis(self):
-        basis = self.confirmed_attribute_implications
         new_implications = self.context.get_attribute_canonical_basis()
-        self.attribute_implications = []
-        for imp in new_implications:
-            if imp not in basis:
-                self.attribute_implications.append(imp)
-                
-        basis = self.confirmed_object_implications
+        self.attribute_implications = _unconfirmed(
+            new_implications, self.confirmed_attribute_implications,
+            self.context.attributes)
+
         transposed_cxt = self.context.transpose()
         new_implications = transposed_cxt.get_attribute_canonical_basis()
-        self.object_implications = []
-        for imp in new_implications:
-            if imp not in basis:
-                self.object_implications.append(imp)
-        
+        self.object_implications = _unconfirmed(
+            new_implications, self.confirmed_object_implications,
+            transposed_cxt.attributes)
+
     def confirm_attribute_implication(self, imp_index):
         imp = self.attribute_implications[imp_index]
         self.confirmed_attribute_implications.append(imp)
@@ -166,28 +166,17 @@ class BasicExploration(object):
         Checks new attribute with *extent* for conflicts with confirmed
         object implications. Return True if all is ok.
         """
-        for imp in self.confirmed_object_implications:
-            if (imp.premise & extent) != imp.premise:
-                continue
-            if (imp.conclusion & extent) == imp.conclusion:
-                continue
-            return False
-
-        return True
+        index = self._object_index.get(self.confirmed_object_implications)
+        return index.respects(extent)
         
     def check_intent_for_conflicts(self, intent):
         """
         Checks new object with *intent* for conflicts with confirmed
         attribute implications. Return True if all is ok.
         """
-        for imp in self.confirmed_attribute_implications:
-            if (imp.premise & intent) != imp.premise:
-                continue
-            if (imp.conclusion & intent) == imp.conclusion:
-                continue
-            return False
-
-        return True
+        index = self._attribute_index.get(
+            self.confirmed_attribute_implications)
+        return index.respects(intent)
         
     def add_object(self, intent, name):
         if not self.check_intent_for_conflicts(intent):
@@ -218,6 +207,25 @@ class BasicExploration(object):
             self.recompute_basis()
 
 
+def _unconfirmed(implications, confirmed, attributes):
+    """
+    Return implications from *implications* that are not in *confirmed*.
+    Both are compared as BitImplications over *attributes*; confirmed
+    implications involving other attributes cannot match and are skipped.
+    """
+    attributes = tuple(attributes)
+    indices = dict((m, i) for i, m in enumerate(attributes))
+    known = set()
+    for imp in confirmed:
+        if all(m in indices
+               for m in imp.get_premise() | imp.get_conclusion()):
+            known.add(fca.BitImplication.from_implication(imp, attributes,
+                                                          indices))
+    return [imp for imp in implications
+            if fca.BitImplication.from_implication(imp, attributes,
+                                                   indices) not in known]
+
+
 if __name__ == "__main__":    
     table = [[True, False, False, True],
              [True, False, True, False],
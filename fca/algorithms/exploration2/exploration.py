@@ -57,6 +57,7 @@ class Basis(object):
     def __init__(self, cxt):
         self._cxt = cxt
         self._background_implications = []
+        self._background_index = fca.ImplicationIndex()
 
     def get_dg_basis(self):
         return fca.compute_dg_basis(self._cxt._cxt, imp_basis=self._background_implications)
@@ -66,12 +67,10 @@ class Basis(object):
 
     def add_background_implication(self, imp):
         self._background_implications.append(imp)
+        self._background_index.add(imp)
 
     def respect_background_knowledge(self, intent):
-        for imp in self._background_implications:
-            if not imp.is_respected(intent):
-                return False
-        return True
+        return self._background_index.respects(intent)
 
 class ExplorationSession(object):
     _cxt = None
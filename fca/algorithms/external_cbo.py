@@ -0,0 +1,219 @@
+# -*- coding: utf-8 -*-
+"""
+Holds an out-of-core implementation of the Close-by-One algorithm
+"""
+import heapq
+import os
+import shutil
+import tempfile
+import weakref
+
+from fca import Concept
+from fca.bitsets import bits2set, full_mask
+from fca.algorithms.closure_operators import implications_to_bits, bits_closure
+
+
+def external_cbo(context, sink, max_frontier=100000, tmp_dir=None,
+                 implications=None):
+    """Find all concepts of a context keeping a bounded working set in RAM
+
+    Concepts are generated level by level with Close-by-One, whose
+    canonicity test does not need previously found concepts. Only the
+    search frontier of the next level is stored; whenever it grows to
+    *max_frontier* records it is sorted and spilled to a temporary file in
+    *tmp_dir*, and sorted runs are merged when the next level is processed.
+
+    Every concept is passed to *sink* (a callable) as soon as it is found.
+    Returns the number of concepts.
+
+    If background *implications* are given, only concepts whose intents
+    respect them are generated: the search runs over sets closed both in
+    the context and under the implications, so the other concepts are
+    pruned rather than filtered out. Other enumerators (norris, lindig,
+    partition_merge) build intents by intersecting object intents or by
+    moving to upper neighbours rather than by closing candidate sets, so
+    they do not take implications; filter their results with
+    Implication.is_respected instead.
+
+    Examples
+    ========
+
+    >>> from fca import Context
+    >>> ct = [[True, False, False, True],\
+              [True, False, True, False],\
+              [False, True, True, False],\
+              [False, True, True, True]]
+    >>> objs = [1, 2, 3, 4]
+    >>> attrs = ['a', 'b', 'c', 'd']
+    >>> c = Context(ct, objs, attrs)
+    >>> cs = []
+    >>> external_cbo(c, cs.append, max_frontier=2)
+    9
+    >>> from fca import Implication
+    >>> external_cbo(c, cs.append, implications=[Implication({'c'}, {'b'})])
+    7
+
+    """
+    n = 0
+    for concept in iterative_external_cbo(context, max_frontier, tmp_dir,
+                                          implications):
+        sink(concept)
+        n += 1
+    return n
+
+
+def iterative_external_cbo(context, max_frontier=100000, tmp_dir=None,
+                           implications=None):
+    """Find all concepts using level-wise Close-by-One with the frontier
+    spilled to disk. Returns an iterator over concepts.
+
+    If *implications* are given, only concepts whose intents respect them
+    are generated.
+
+    :return: iterator over concepts
+    """
+    attribute_bits = context.attribute_bits
+    num_atts = len(context.attributes)
+    codec = _RecordCodec(len(context.objects), num_atts)
+    if implications:
+        imps = implications_to_bits(implications, context.attribute_indices)
+
+    def make_concept(extent, intent):
+        return Concept(bits2set(extent, context.objects),
+                       bits2set(intent, context.attributes))
+
+    def close(extent, intent):
+        # closure in the context
+        if not implications:
+            return extent, context.oprime_bits(extent)
+        # closure both in the context and under the implications
+        while True:
+            intent = bits_closure(intent, imps)
+            extent &= context.aprime_bits(intent)
+            new_intent = context.oprime_bits(extent)
+            if new_intent == intent:
+                return extent, intent
+            intent = new_intent
+
+    extent, intent = close(full_mask(len(context.objects)), 0)
+    yield make_concept(extent, intent)
+    frontier = _Frontier(codec.size, max_frontier, tmp_dir)
+    frontier.append(codec.encode(extent, intent, 0))
+    while len(frontier):
+        next_frontier = _Frontier(codec.size, max_frontier, tmp_dir)
+        for record in frontier:
+            extent, intent, start = codec.decode(record)
+            for j in range(start, num_atts):
+                if intent >> j & 1:
+                    continue
+                new_extent, new_intent = close(extent & attribute_bits[j],
+                                               intent | 1 << j)
+                # canonicity test: no new attributes before j
+                prefix = full_mask(j)
+                if new_intent & prefix != intent & prefix:
+                    continue
+                yield make_concept(new_extent, new_intent)
+                if j + 1 < num_atts:
+                    next_frontier.append(codec.encode(new_extent, new_intent,
+                                                      j + 1))
+        frontier = next_frontier
+
+
+class _RecordCodec(object):
+    """Fixed-size binary records (intent, extent, next attribute index)"""
+    def __init__(self, num_objs, num_atts):
+        self.extent_size = (num_objs + 7) // 8
+        self.intent_size = (num_atts + 7) // 8
+        self.size = self.intent_size + self.extent_size + 4
+
+    def encode(self, extent, intent, start):
+        return (intent.to_bytes(self.intent_size, 'big') +
+                extent.to_bytes(self.extent_size, 'big') +
+                start.to_bytes(4, 'big'))
+
+    def decode(self, record):
+        i = self.intent_size
+        e = i + self.extent_size
+        return (int.from_bytes(record[i:e], 'big'),
+                int.from_bytes(record[:i], 'big'),
+                int.from_bytes(record[e:], 'big'))
+
+
+class _Frontier(object):
+    """
+    Collection of fixed-size records which spills sorted runs to files in
+    a temporary directory when it grows to *max_size* records. Iteration
+    merges the runs in sorted order; runs are merged in passes of at most
+    *fan_in* files, so only that many files are open at a time. The
+    directory is removed when the frontier is garbage collected.
+    """
+    def __init__(self, record_size, max_size, tmp_dir, fan_in=64):
+        self._record_size = record_size
+        self._max_size = max_size
+        self._tmp_dir = tmp_dir
+        self._fan_in = max(fan_in, 2)
+        self._dir = None
+        self._records = []
+        self._runs = []
+        self._len = 0
+
+    def __len__(self):
+        return self._len
+
+    def append(self, record):
+        self._records.append(record)
+        self._len += 1
+        if len(self._records) >= self._max_size:
+            self._spill()
+
+    def _new_run(self):
+        if self._dir is None:
+            self._dir = tempfile.mkdtemp(dir=self._tmp_dir)
+            weakref.finalize(self, shutil.rmtree, self._dir, True)
+        fd, path = tempfile.mkstemp(dir=self._dir)
+        return os.fdopen(fd, 'wb'), path
+
+    def _spill(self):
+        self._records.sort()
+        run, path = self._new_run()
+        with run:
+            run.write(b''.join(self._records))
+        self._runs.append(path)
+        self._records = []
+
+    def _read_run(self, path):
+        try:
+            with open(path, 'rb') as run:
+                while True:
+                    record = run.read(self._record_size)
+                    if not record:
+                        break
+                    yield record
+        finally:
+            os.remove(path)
+
+    def _merge_runs(self):
+        # leave room for the stream of records kept in memory
+        while len(self._runs) >= self._fan_in:
+            merged = []
+            for k in range(0, len(self._runs), self._fan_in):
+                group = self._runs[k:k + self._fan_in]
+                if len(group) == 1:
+                    merged.append(group[0])
+                    continue
+                run, path = self._new_run()
+                with run:
+                    for record in heapq.merge(*[self._read_run(p)
+                                                for p in group]):
+                        run.write(record)
+                merged.append(path)
+            self._runs = merged
+
+    def __iter__(self):
+        self._records.sort()
+        self._merge_runs()
+        streams = [iter(self._records)]
+        streams += [self._read_run(path) for path in self._runs]
+        self._runs = []
+        for record in heapq.merge(*streams):
+            yield record
@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+"""
+Holds functions that compute minimal generators and proper premises
+"""
+from fca.implication import Implication
+from fca.bitsets import bits2set, full_mask, popcount
+
+
+def minimal_generators(cxt, min_support=0.0):
+    """Compute minimal generators of intents of a given *cxt*
+
+    A set of attributes X is a minimal generator (a key set) of intent
+    X'' if no proper subset of X has the same closure, or, equivalently,
+    if the extent of X is strictly smaller than the extent of every
+    subset X - {x}. Key sets are closed under subsets, so they are found
+    level-wise, from smaller sets to larger ones, as in Apriori: a
+    candidate is formed only if all its immediate subsets are keys, its
+    extent is the intersection of the extent of a subset with an
+    attribute extent, and it is discarded as soon as the extent equals
+    the extent of a subset. Candidates supported by less than
+    *min_support* (a fraction of objects) are discarded too, and so are
+    their supersets.
+
+    Returns a dictionary mapping every intent (a frozenset) with support
+    at least *min_support* to the list of its minimal generators ordered
+    by size.
+
+    Examples
+    ========
+
+    >>> from fca import Context
+    >>> ct = [[True, False, False, True],\
+              [True, False, True, False],\
+              [False, True, True, False],\
+              [False, True, True, True]]
+    >>> c = Context(ct, ['1', '2', '3', '4'], ['a', 'b', 'c', 'd'])
+    >>> generators = minimal_generators(c)
+    >>> [sorted(g) for g in generators[frozenset(['b', 'c'])]]
+    [['b']]
+    >>> [sorted(g) for g in generators[frozenset(['a', 'b', 'c', 'd'])]]
+    [['a', 'b'], ['a', 'c', 'd']]
+    >>> len(minimal_generators(c, min_support=0.5))
+    5
+
+    """
+    attributes = cxt.attributes
+    generators = {}
+    for level in _key_levels(cxt, min_support):
+        for key in sorted(level):
+            intent = frozenset(bits2set(level[key][1], attributes))
+            generators.setdefault(intent, []).append(
+                frozenset(bits2set(key, attributes)))
+    return generators
+
+
+def proper_premise_basis(cxt, min_support=0.0):
+    """Compute the implications with proper premises of a given *cxt*
+
+    For a set of attributes P let P* be P'' without P and without the
+    closures of all subsets P - {p}. P is a proper premise if P* is not
+    empty; then P is a key set and P => P* holds. Implications with
+    proper premises form a direct basis of the context, the same as the
+    canonical direct basis computed by compute_direct_basis, but they are
+    obtained from the context alone, without computing a basis first:
+    key sets are enumerated level-wise as in minimal_generators and the
+    closures of their immediate subsets are taken from the previous
+    level.
+
+    Only premises with support at least *min_support* are considered, so
+    for positive *min_support* the result is the part of the basis
+    relevant to frequent attribute sets.
+
+    Implications are returned ordered by premise size.
+
+    Examples
+    ========
+
+    >>> from fca import Context
+    >>> ct = [[True, False, False, True],\
+              [True, False, True, False],\
+              [False, True, True, False],\
+              [False, True, True, True]]
+    >>> c = Context(ct, ['1', '2', '3', '4'], ['a', 'b', 'c', 'd'])
+    >>> for imp in proper_premise_basis(c):
+    ...     print(imp)
+    b => c
+    a, b => d
+    c, d => b
+
+    """
+    attributes = cxt.attributes
+    basis = []
+    for level in _key_levels(cxt, min_support):
+        for key in sorted(level):
+            _, intent, subclosures = level[key]
+            conclusion = intent & ~(key | subclosures)
+            if conclusion:
+                basis.append(Implication(bits2set(key, attributes),
+                                         bits2set(key | conclusion,
+                                                  attributes)))
+    return basis
+
+
+def _key_levels(cxt, min_support=0.0):
+    """
+    Generate levels of key sets of *cxt* with support at least
+    *min_support*. A level of keys of size k is a dictionary mapping a key
+    (bitset over attribute indices) to the triple (extent, intent, union
+    of intents of its subsets of size k - 1).
+    """
+    min_count = min_support * len(cxt.objects)
+    attribute_bits = cxt.attribute_bits
+    all_objects = full_mask(len(cxt.objects))
+    level = {0: (all_objects, cxt.oprime_bits(all_objects), 0)}
+    while level:
+        yield level
+        next_level = {}
+        for key, (extent, intent, _) in level.items():
+            for j in range(key.bit_length(), len(attribute_bits)):
+                if intent >> j & 1:
+                    # key | {j} has the same extent as key
+                    continue
+                candidate = key | 1 << j
+                candidate_extent = extent & attribute_bits[j]
+                if popcount(candidate_extent) < min_count:
+                    continue
+                subclosures = intent
+                rest = key
+                while rest:
+                    bit = rest & -rest
+                    rest ^= bit
+                    subset = level.get(candidate ^ bit)
+                    if subset is None or subset[0] == candidate_extent:
+                        break
+                    subclosures |= subset[1]
+                else:
+                    next_level[candidate] = (candidate_extent,
+                                             cxt.oprime_bits(candidate_extent),
+                                             subclosures)
+        level = next_level
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+"""
+Holds a function that checks implications against a context
+"""
+import numpy as np
+
+
+def check_implications(cxt, imps, batch_size=4096):
+    """Check implications *imps* against context *cxt*
+
+    Returns the list of triples (support, confidence, violators), one for
+    every implication A => B:
+
+    - support is the fraction of objects having all attributes of A and B;
+    - confidence is the fraction of objects having all attributes of A that
+      also have all attributes of B (1.0 if no object has A);
+    - violators is the array of indices of objects having A but not B.
+
+    *imps* can be any iterable of implications. They are processed in
+    batches of *batch_size*. For every batch the cross table is multiplied
+    by the matrices of premises and of premises united with conclusions;
+    an object has a set of attributes iff the corresponding product equals
+    the size of the set. Attributes absent from *cxt* are never had by any
+    object. The boolean table is converted to numbers block by block, so
+    apart from the results memory is O(|G| * batch_size) for the boolean
+    membership matrices plus a float32 copy of at most 65536 rows.
+
+    Examples
+    ========
+
+    >>> from fca import Context, Implication
+    >>> ct = [[True, False, False, True],\
+              [True, False, True, False],\
+              [False, True, True, False],\
+              [False, True, True, True]]
+    >>> c = Context(ct, [1, 2, 3, 4], ['a', 'b', 'c', 'd'])
+    >>> imps = [Implication({'b'}, {'c'}), Implication({'c'}, {'b'})]
+    >>> [(s, round(conf, 2), v.tolist())
+    ...  for s, conf, v in check_implications(c, imps)]
+    [(0.5, 1.0, []), (0.5, 0.67, [1])]
+
+    """
+    imps = list(imps)
+    table = cxt._shaped_table()
+    num_objs = len(cxt.objects)
+    attribute_indices = cxt.attribute_indices
+    results = []
+    for start in range(0, len(imps), batch_size):
+        batch = imps[start:start + batch_size]
+        premises = [imp.get_premise() for imp in batch]
+        wholes = [imp.get_premise() | imp.get_conclusion() for imp in batch]
+        has_premise = _have_sets(table, premises, attribute_indices)
+        has_whole = _have_sets(table, wholes, attribute_indices)
+        premise_counts = has_premise.sum(axis=0)
+        whole_counts = has_whole.sum(axis=0)
+        violations = has_premise & ~has_whole
+        for k in range(len(batch)):
+            support = whole_counts[k] / num_objs if num_objs else 0.0
+            if premise_counts[k]:
+                confidence = whole_counts[k] / premise_counts[k]
+            else:
+                confidence = 1.0
+            results.append((float(support), float(confidence),
+                            np.nonzero(violations[:, k])[0]))
+    return results
+
+
+def _have_sets(table, attribute_sets, attribute_indices, block_rows=65536):
+    """
+    Return the boolean |G| x len(*attribute_sets*) matrix telling which
+    objects of boolean *table* have all attributes of each set. Rows are
+    multiplied in blocks of *block_rows*; float32 counts are exact for any
+    realistic number of attributes.
+    """
+    masks = np.zeros((len(attribute_sets), table.shape[1]), dtype=np.float32)
+    sizes = np.zeros(len(attribute_sets), dtype=np.float32)
+    for k, attribute_set in enumerate(attribute_sets):
+        sizes[k] = len(attribute_set)
+        for m in attribute_set:
+            if m in attribute_indices:
+                masks[k, attribute_indices[m]] = 1
+    masks = masks.T
+    result = np.empty((table.shape[0], len(attribute_sets)), dtype=bool)
+    for start in range(0, table.shape[0], block_rows):
+        block = table[start:start + block_rows].astype(np.float32)
+        result[start:start + block_rows] = block.dot(masks) == sizes
+    return result
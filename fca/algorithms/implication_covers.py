@@ -6,26 +6,179 @@ import copy
 
 from . import closure_operators
 from fca.implication import Implication
+from fca.implication_system import ImplicationSystem
+from fca.bitsets import set2bits, bits2set, iter_bits, popcount, full_mask
 import fca
 
 
-def compute_implication_cover(cxt, close=closure_operators.closure):
+def compute_implication_cover(cxt, close=None):
     """
     Compute an implication cover for a given *cxt* using 
-    an object-incremental algorithm
+    an object-incremental algorithm, see ImplicationCover. *close* is not
+    used and kept for compatibility.
     """
-    attributes = set(cxt.attributes)
-    basis = [Implication(set(), attributes.copy())]
-    i = 0
+    cover = ImplicationCover(cxt.attributes)
     for intent in cxt.examples():
-        i += 1
-        print('object ', i)
-#        print_basis(basis)
-#        print 'Adding ', intent
-#        raw_input()
-        basis = updated_basis(intent, basis, attributes)
-        print(len(basis), 'implications')
-    return basis
+        cover.update(intent)
+    return cover.implications
+
+
+class ImplicationCover(object):
+    """Implication cover maintained object by object
+
+    Starts with the cover of the context without objects, {} => M, and
+    is updated with every new object intent: implications violated by the
+    intent are removed and replaced by weakened ones, as in updated_basis.
+
+    Premises and reduced conclusions are stored as bitsets over attribute
+    indices, and for every attribute the bitsets of ids of implications
+    having it in the premise or in the conclusion are kept. Subsumption
+    queries (implications whose premises are contained in a set and whose
+    conclusions contain another one, and vice versa) are answered with a
+    few operations on these bitsets instead of scanning the cover. Removed
+    implications are only marked as such; ids are compacted when most of
+    them are removed.
+
+    Examples
+    ========
+
+    >>> cover = ImplicationCover(['a', 'b', 'c'])
+    >>> cover.update({'a', 'b'})
+    >>> cover.update({'b', 'c'})
+    >>> cover.implications
+    [ => b]
+    >>> cover.update({'c'})
+    >>> cover.implications
+    [a => b]
+
+    """
+    def __init__(self, attributes):
+        self._attributes = list(attributes)
+        self._indices = dict((m, i) for i, m in enumerate(self._attributes))
+        self._full = full_mask(len(self._attributes))
+        self._premises = []
+        self._conclusions = []
+        self._premise_index = [0] * len(self._attributes)
+        self._conclusion_index = [0] * len(self._attributes)
+        self._alive = 0
+        self._num_alive = 0
+        self._add(0, self._full)
+
+    def __len__(self):
+        return self._num_alive
+
+    def get_implications(self):
+        """Return the list of implications of the cover"""
+        return [Implication(bits2set(self._premises[i], self._attributes),
+                            bits2set(self._conclusions[i], self._attributes))
+                for i in iter_bits(self._alive)]
+
+    implications = property(get_implications)
+
+    def _add(self, premise, conclusion):
+        i = len(self._premises)
+        self._premises.append(premise)
+        self._conclusions.append(conclusion)
+        bit = 1 << i
+        for m in iter_bits(premise):
+            self._premise_index[m] |= bit
+        for m in iter_bits(conclusion):
+            self._conclusion_index[m] |= bit
+        self._alive |= bit
+        self._num_alive += 1
+        return bit
+
+    def _remove(self, ids):
+        self._alive &= ~ids
+        self._num_alive -= popcount(ids)
+
+    def _compact(self):
+        alive = list(iter_bits(self._alive))
+        premises = [self._premises[i] for i in alive]
+        conclusions = [self._conclusions[i] for i in alive]
+        self._premises = []
+        self._conclusions = []
+        self._premise_index = [0] * len(self._attributes)
+        self._conclusion_index = [0] * len(self._attributes)
+        self._alive = 0
+        self._num_alive = 0
+        for premise, conclusion in zip(premises, conclusions):
+            self._add(premise, conclusion)
+
+    def _within(self, index, bits):
+        # ids of implications whose sets from index are contained in bits
+        outside = 0
+        for m in iter_bits(self._full & ~bits):
+            outside |= index[m]
+        return self._alive & ~outside
+
+    def _containing(self, index, bits):
+        # ids of implications whose sets from index contain bits
+        ids = self._alive
+        for m in iter_bits(bits):
+            ids &= index[m]
+        return ids
+
+    def _subsuming(self, premise, conclusion):
+        # ids of implications i with i.premise <= premise and
+        # conclusion <= i.conclusion
+        return (self._within(self._premise_index, premise) &
+                self._containing(self._conclusion_index, conclusion))
+
+    def _subsumed(self, premise, conclusion):
+        # ids of implications i with premise <= i.premise and
+        # i.conclusion <= conclusion
+        return (self._containing(self._premise_index, premise) &
+                self._within(self._conclusion_index, conclusion))
+
+    def update(self, intent):
+        """Update the cover with a new object having attributes *intent*"""
+        x = set2bits([m for m in intent if m in self._indices], self._indices)
+        # implications violated by the intent
+        invalid_ids = (self._within(self._premise_index, x) &
+                       ~self._within(self._conclusion_index, x))
+        invalid = [(self._premises[i], self._conclusions[i])
+                   for i in iter_bits(invalid_ids)]
+        self._remove(invalid_ids)
+        # implications weakened by the intent
+        valid = self._alive
+        new_valid = 0
+        for premise, conclusion in invalid:
+            conclusion &= x
+            if not conclusion:
+                continue
+            if self._subsuming(premise, conclusion) & (valid | new_valid):
+                continue
+            subsumed = self._subsumed(premise, conclusion) & new_valid
+            self._remove(subsumed)
+            new_valid &= ~subsumed
+            new_valid |= self._add(premise, conclusion)
+        # implications with premises extended by attributes not in the intent
+        new_valid = 0
+        for premise, conclusion in invalid:
+            for m in iter_bits(self._full & ~x):
+                bit = 1 << m
+                new_premise = premise | bit
+                new_conclusion = conclusion & ~bit
+                if not new_conclusion:
+                    continue
+                valid = self._alive & ~new_valid
+                if self._subsuming(new_premise, new_conclusion) & valid:
+                    continue
+                self._remove(self._subsumed(new_premise, new_conclusion) &
+                             valid)
+                same = (self._within(self._premise_index, new_premise) &
+                        self._containing(self._premise_index, new_premise))
+                if (same | self._subsuming(new_premise, new_conclusion)) & \
+                        new_valid:
+                    continue
+                subsumed = (self._subsumed(new_premise, new_conclusion) &
+                            new_valid)
+                self._remove(subsumed)
+                new_valid &= ~subsumed
+                new_valid |= self._add(new_premise, new_conclusion)
+        if len(self._premises) > 2 * self._num_alive + 64:
+            self._compact()
 
 
 def print_basis(basis):
@@ -141,21 +294,88 @@ def updated_basis(intent, basis, attributes):
     return valid + new_valid
                     
 
-def minimize(cover, close=closure_operators.simple_closure):
-#    i = 0
-#    for imp in cover:
-#        i += 1
-#        print 'maximizing conclusion ', i
-#        imp._conclusion = close(imp.premise | imp.conclusion, cover)
-    i = 0
-    for imp in cover[:]:
-        i += 1
-        print('maximizing premise ', i)
-        cover.remove(imp)
-        imp._premise = close(imp.premise, cover)
-        if not imp.conclusion <= imp.premise:
-            cover.append(imp)
-        print((len(cover), 'implications'))
+def minimize(cover, close=None):
+    """
+    Replace implications of *cover* by its minimum cover, see
+    minimum_cover. *close* is not used and kept for compatibility.
+    """
+    cover[:] = minimum_cover(cover)
+
+
+def minimum_cover(implications, reduce_left=False, reduce_right=False):
+    """Compute a minimum cover of *implications*
+
+    Implications are compiled into an ImplicationSystem once, then every
+    conclusion is replaced by the closure of its premise and every premise
+    by its closure under the other implications; implications whose
+    premises become closed are redundant and are dropped. The result is
+    the Duquenne-Guigues basis of *implications*, which has the minimum
+    number of implications. Each step is one LinClosure, i.e. linear in
+    the size of *implications*.
+
+    If *reduce_left*, attributes that can be dropped from premises without
+    changing the closure system are removed. If *reduce_right*,
+    attributes of conclusions that follow from the premise by the other
+    implications are removed. The number of implications stays minimum.
+
+    *implications* are not changed, new Implication instances are returned.
+
+    Examples
+    ========
+
+    >>> imps = [Implication({'a'}, {'b'}), Implication({'b'}, {'c'}),
+    ...         Implication({'a'}, {'c'}), Implication({'a', 'c'}, {'b'})]
+    >>> for imp in minimum_cover(imps):
+    ...     print(imp)
+    b => c
+    a => b, c
+    >>> for imp in minimum_cover(imps, reduce_right=True):
+    ...     print(imp)
+    b => c
+    a => b
+
+    """
+    system = ImplicationSystem(implications)
+    attributes = system.attributes
+    n = len(system)
+    # right saturation: conclusions become closures of premises
+    for i in range(n):
+        premise, conclusion = system.get_bits(i)
+        system.set_bits(i, premise, system.close(premise | conclusion))
+    # left saturation: premises are closed under the other implications
+    for i in range(n):
+        premise, conclusion = system.get_bits(i)
+        system.set_bits(i, 0, 0)
+        premise = system.close(premise)
+        if premise != conclusion:
+            system.set_bits(i, premise, conclusion)
+    alive = [i for i in range(n) if system.get_bits(i)[1]]
+    if reduce_left:
+        for i in alive:
+            premise, conclusion = system.get_bits(i)
+            for m in iter_bits(premise):
+                smaller = premise & ~(1 << m)
+                if system.close(smaller) & conclusion == conclusion:
+                    premise = smaller
+                    system.set_bits(i, premise, conclusion)
+    if reduce_right:
+        for i in alive:
+            premise, conclusion = system.get_bits(i)
+            conclusion &= ~premise
+            system.set_bits(i, premise, conclusion)
+            for m in iter_bits(conclusion):
+                smaller = conclusion & ~(1 << m)
+                system.set_bits(i, premise, smaller)
+                if system.close(premise) >> m & 1:
+                    conclusion = smaller
+                else:
+                    system.set_bits(i, premise, conclusion)
+    result = []
+    for i in alive:
+        premise, conclusion = system.get_bits(i)
+        result.append(Implication(bits2set(premise, attributes),
+                                  bits2set(premise | conclusion, attributes)))
+    return result
 
 
 if __name__ == "__main__":    
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+"""Holds implementation of Lindig's algorithm"""
+
+from collections import deque
+
+from fca import Concept
+from fca.bitsets import bits2set, iter_bits, full_mask
+
+
+def lindig(context, with_parents=True):
+    """Build all concepts of a context together with the covering relation
+
+    Based on Lindig's algorithm (Fast Concept Analysis, 2000): concepts are
+    generated from the bottom concept upwards by computing upper neighbours,
+    hence the covering relation is obtained during enumeration and does
+    not need a separate pass.
+
+    Returns the same as norris: a list of concepts and, if *with_parents*,
+    a dictionary containing sets of parents for each concept.
+
+    Examples
+    ========
+
+    >>> from fca import Context, ConceptLattice
+    >>> ct = [[True, False, False, True],\
+              [True, False, True, False],\
+              [False, True, True, False],\
+              [False, True, True, True]]
+    >>> objs = [1, 2, 3, 4]
+    >>> attrs = ['a', 'b', 'c', 'd']
+    >>> c = Context(ct, objs, attrs)
+    >>> cl = ConceptLattice(c, builder=lindig)
+    >>> len(cl)
+    9
+
+    """
+    cs = []
+    parents = {}
+    for concept, upper in iterative_lindig(context):
+        cs.append(concept)
+        parents[concept] = set(upper)
+    if with_parents:
+        return (cs, parents)
+    else:
+        return cs
+
+
+def iterative_lindig(context):
+    """Find all concepts using Lindig's algorithm. Returns an iterator over
+    pairs (concept, list of its upper neighbours). Every upper neighbour is
+    itself generated later by the iterator.
+
+    :return: iterator over pairs (concept, upper neighbours)
+    """
+    def make_concept(extent, intent):
+        return Concept(bits2set(extent, context.objects),
+                       bits2set(intent, context.attributes))
+
+    bottom_extent = context.aprime_bits(full_mask(len(context.attributes)))
+    bottom_intent = context.oprime_bits(bottom_extent)
+    found = {bottom_extent: make_concept(bottom_extent, bottom_intent)}
+    queue = deque([(bottom_extent, bottom_intent)])
+    while queue:
+        extent, intent = queue.popleft()
+        upper = []
+        for new_extent, new_intent in upper_neighbours(context, extent, intent):
+            if new_extent not in found:
+                found[new_extent] = make_concept(new_extent, new_intent)
+                queue.append((new_extent, new_intent))
+            upper.append(found[new_extent])
+        yield found[extent], upper
+
+
+def upper_neighbours(context, extent, intent):
+    """
+    Return the list of upper neighbours of the concept (*extent*, *intent*).
+    Extents and intents are bitsets over object and attribute indices.
+    """
+    object_bits = context.object_bits
+    candidates = full_mask(len(context.objects)) & ~extent
+    minimal = candidates
+    neighbours = []
+    for g in iter_bits(candidates):
+        g_bit = 1 << g
+        new_intent = intent & object_bits[g]
+        new_extent = context.aprime_bits(new_intent)
+        if minimal & new_extent & ~extent & ~g_bit:
+            minimal &= ~g_bit
+        else:
+            neighbours.append((new_extent, new_intent))
+    return neighbours
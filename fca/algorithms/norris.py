@@ -3,6 +3,8 @@
 
 from copy import copy
 from fca import Concept, ConceptSystem
+from fca.bitsets import set2bits, iter_bits, full_mask
+from fca.algorithms.checkpoint import save_checkpoint, load_checkpoint
 
 
 def norris(context, with_parents=True):
@@ -48,39 +50,73 @@ def norris(context, with_parents=True):
         return cs
 
 
-def iterative_norris(context):
+def iterative_norris(context, checkpoint=None, checkpoint_every=100,
+                     resume_from=None):
     """Find all concepts using Norris algorithm. Returns an iterator, hence,
     one can use concepts as they are discovered.
 
+    Intents of yielded concepts are final, extents are completed when the
+    iterator is exhausted.
+
+    If *checkpoint* is a file name, concepts found so far and the index of
+    the next object are saved to it every *checkpoint_every* objects and
+    when the iterator is exhausted. Given such a file as *resume_from*, the
+    iterator first yields the saved concepts and then continues with the
+    next object of the same *context*.
+
     :return: iterator over concepts
     """
     examples = []
     for ex in context.examples():
         examples.append(ex)
 
-    top_cpt = Concept([], context.attributes)
+    if resume_from is not None:
+        state = load_checkpoint(resume_from, 'norris')
+        start = state['next_object']
+        # Concepts are immutable, hence extents are grown in separate sets
+        extents = state['extents']
+        cs = [Concept(extent, intent)
+              for extent, intent in zip(extents, state['intents'])]
+    else:
+        start = 0
+        extents = [set()]
+        cs = [Concept([], context.attributes)]
     #
-    yield top_cpt
+    for c in cs:
+        yield c
     #
-    cs = [top_cpt]
-    for i in range(len(context)):
-        cs_for_loop = cs[:]
-        for c in cs_for_loop:
+    for i in range(start, len(context)):
+        if checkpoint is not None and i % checkpoint_every == 0:
+            _save_norris_state(checkpoint, i, cs, extents)
+        for k in range(len(cs)):
+            c = cs[k]
             if c.intent.issubset(examples[i]):
-                c.extent.add(context.objects[i])
+                extents[k].add(context.objects[i])
             else:
                 new_intent = c.intent & examples[i]
                 new = True
                 for j in range(i):
                     if new_intent.issubset(examples[j]) and \
-                            context.objects[j] not in c.extent:
+                            context.objects[j] not in extents[k]:
                         new = False
                         break
                 if new:
-                    new_cpt = Concept({context.objects[i]} | c.extent,
-                                      new_intent)
+                    new_extent = {context.objects[i]} | extents[k]
+                    new_cpt = Concept(new_extent, new_intent)
                     yield new_cpt
                     cs.append(new_cpt)
+                    extents.append(new_extent)
+    if checkpoint is not None:
+        _save_norris_state(checkpoint, len(context), cs, extents)
+    for c, extent in zip(cs, extents):
+        c.extent = extent
+
+
+def _save_norris_state(path, next_object, cs, extents):
+    save_checkpoint(path, 'norris',
+                    {'next_object': next_object,
+                     'intents': [c.intent for c in cs],
+                     'extents': extents})
 
 
 def compute_covering_relation(cs):
@@ -88,6 +124,11 @@ def compute_covering_relation(cs):
 
     Returns a dictionary containing sets of parents for each concept.
 
+    Intents are compared as bitsets, so the running time is
+    O(|cs|^2 * |M| / w) instead of O(|cs|^3) set comparisons, where w is
+    the machine word size. Works for any concept system, not only for
+    complete lattices.
+
     Examples
     ========
 
@@ -140,14 +181,50 @@ def compute_covering_relation(cs):
     <<< (G, [])
 
     """
-    parents = dict([(c, set()) for c in cs])
-
-    for i in range(len(cs)):
-        for j in range(len(cs)):
-            if cs[i].intent < cs[j].intent:
-                parents[cs[j]].add(cs[i])
-                for k in range(len(cs)):
-                    if cs[i].intent < cs[k].intent < cs[j].intent:
-                        parents[cs[j]].remove(cs[i])
-                        break
+    # Concepts are numbered by decreasing intent size, so among the concepts
+    # whose intents are strictly contained in a given intent the one with
+    # the smallest number is always a cover. Up-sets are kept as bitsets
+    # over these numbers.
+    concepts = [c for c in cs]
+    parents = dict([(c, set()) for c in concepts])
+    if not concepts:
+        return parents
+    order = sorted(range(len(concepts)),
+                   key=lambda i: len(concepts[i].intent), reverse=True)
+    concepts = [concepts[i] for i in order]
+    attributes = set()
+    for c in concepts:
+        attributes |= c.intent
+    attribute_indices = dict((a, j) for j, a in enumerate(attributes))
+    intents = [set2bits(c.intent, attribute_indices) for c in concepts]
+    # concepts_with[j] is the bitset of concepts having attribute j
+    concepts_with = [0] * len(attributes)
+    for k, intent in enumerate(intents):
+        for j in iter_bits(intent):
+            concepts_with[j] |= 1 << k
+
+    all_attributes = full_mask(len(attributes))
+    all_concepts = full_mask(len(concepts))
+    smaller = [0] * len(concepts)
+    first_smaller = len(concepts)
+    for k in range(len(concepts) - 1, -1, -1):
+        if (k < len(concepts) - 1 and
+                len(concepts[k].intent) > len(concepts[k + 1].intent)):
+            first_smaller = k + 1
+        smaller[k] = all_concepts & ~full_mask(first_smaller)
+
+    ups = []
+    for k, intent in enumerate(intents):
+        not_subsets = 0
+        for j in iter_bits(all_attributes & ~intent):
+            not_subsets |= concepts_with[j]
+        ups.append(smaller[k] & ~not_subsets)
+
+    for k, c in enumerate(concepts):
+        candidates = ups[k]
+        while candidates:
+            low = candidates & -candidates
+            p = low.bit_length() - 1
+            parents[c].add(concepts[p])
+            candidates &= ~(ups[p] | low)
     return parents
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+"""
+Holds functions that compute concepts of a context split by objects
+"""
+import fca
+from fca import Concept
+from fca.bitsets import set2bits, bits2set, full_mask
+from fca.algorithms.external_cbo import iterative_external_cbo
+from fca.algorithms.norris import compute_covering_relation
+
+
+def split_context(context, n):
+    """Split *context* by objects into *n* contexts with the same attributes"""
+    size = max(-(-len(context.objects) // n), 1)
+    shards = []
+    for start in range(0, max(len(context.objects), 1), size):
+        objects = context.objects[start:start + size]
+        table = context._shaped_table()[start:start + size]
+        shards.append(fca.Context(table, objects, context.attributes))
+    return shards
+
+
+def shard_intents(context):
+    """
+    Return the set of intents of *context* as bitsets over attribute
+    indices. The intent of the empty extent (all attributes) is included.
+    """
+    attribute_indices = context.attribute_indices
+    intents = set(set2bits(c.intent, attribute_indices)
+                  for c in iterative_external_cbo(context))
+    intents.add(full_mask(len(context.attributes)))
+    return intents
+
+
+def merge_intents(intents, other_intents):
+    """
+    Return intents of the union of two contexts with the same attributes
+    given intents of each of them: every intent of the union is an
+    intersection of an intent of the first and an intent of the second.
+    """
+    return set(b1 & b2 for b1 in intents for b2 in other_intents)
+
+
+def _merge_pair(pair):
+    return merge_intents(*pair)
+
+
+def partition_merge(shards, pool=None, with_parents=True):
+    """Build all concepts of a context given as object shards
+
+    *shards* are contexts with the same attributes and disjoint objects.
+    Intents of every shard are computed independently and then merged
+    pairwise in a tree; finally extents and, if *with_parents*, the
+    covering relation are computed.
+
+    *pool* is used for the map steps, it can be a multiprocessing.Pool or
+    any object with a compatible map method; by default everything is
+    computed in the current process.
+
+    Returns the same as norris.
+
+    Examples
+    ========
+
+    >>> from fca import Context
+    >>> ct = [[True, False, False, True],\
+              [True, False, True, False],\
+              [False, True, True, False],\
+              [False, True, True, True]]
+    >>> objs = [1, 2, 3, 4]
+    >>> attrs = ['a', 'b', 'c', 'd']
+    >>> c = Context(ct, objs, attrs)
+    >>> cs, parents = partition_merge(split_context(c, 2))
+    >>> len(cs)
+    9
+
+    """
+    if not shards:
+        raise ValueError("At least one shard is required")
+    attributes = shards[0].attributes
+    for shard in shards:
+        if shard.attributes != attributes:
+            raise ValueError("Shards must have the same attributes")
+    map_ = pool.map if pool is not None else lambda f, xs: list(map(f, xs))
+
+    parts = map_(shard_intents, shards)
+    while len(parts) > 1:
+        pairs = [(parts[i], parts[i + 1]) for i in range(0, len(parts) - 1, 2)]
+        merged = map_(_merge_pair, pairs)
+        if len(parts) % 2:
+            merged.append(parts[-1])
+        parts = merged
+
+    cs = []
+    for intent in sorted(parts[0]):
+        extent = set()
+        for shard in shards:
+            extent |= bits2set(shard.aprime_bits(intent), shard.objects)
+        cs.append(Concept(extent, bits2set(intent, attributes)))
+    if with_parents:
+        return (cs, compute_covering_relation(cs))
+    else:
+        return cs
@@ -9,6 +9,7 @@ classify the respective object as positive.
 import copy
 
 from fca import Concept
+from fca.implication_index import SetIndex, IndexCache
 from fca.algorithms import factors
 
 
@@ -114,6 +115,7 @@ class BasicPatternExploration:
         # self.negative_cpts = self.negative_cxt.concepts
         self.expert = expert
         self.confirmed_patterns = []
+        self._pattern_index = IndexCache(SetIndex)
         self.pattern_generator = pattern_generator
 
     def iterate_patterns_with_examples(self):
@@ -159,8 +161,8 @@ class BasicPatternExploration:
         return self
 
     def is_explained(self, intent):
-        return any(pattern <= set(intent)
-                   for pattern in self.confirmed_patterns)
+        index = self._pattern_index.get(self.confirmed_patterns)
+        return index.has_subset_of(intent)
 
     def iterate_unexplained_examples(self):
         for obj_ind, obj_name in enumerate(self.positive_cxt.objects):
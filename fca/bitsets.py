@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+"""
+Helpers for sets of indices represented as Python integers (bitsets).
+
+Bit *i* of an integer is set iff the element with index *i* belongs to the
+set. Python integers are arbitrary-precision, so a bitset can describe a set
+over any number of elements, and intersection, union and inclusion tests
+become single bitwise operations.
+
+Examples
+========
+
+>>> bits = set2bits(['b', 'c'], {'a': 0, 'b': 1, 'c': 2})
+>>> bits
+6
+>>> list(iter_bits(bits))
+[1, 2]
+>>> sorted(bits2set(bits, ['a', 'b', 'c']))
+['b', 'c']
+>>> popcount(bits)
+2
+"""
+import numpy as np
+
+
+def set2bits(elements, indices):
+    """
+    Return the bitset of *elements*; *indices* maps an element to its index.
+    """
+    bits = 0
+    for el in elements:
+        bits |= 1 << indices[el]
+    return bits
+
+
+def inds2bits(inds):
+    """Return the bitset containing given indices."""
+    bits = 0
+    for i in inds:
+        bits |= 1 << int(i)
+    return bits
+
+
+def iter_bits(bits):
+    """Generator. Yield indices of set bits in increasing order."""
+    while bits:
+        low = bits & -bits
+        yield low.bit_length() - 1
+        bits ^= low
+
+
+def bits2inds(bits):
+    """Return the list of indices of set bits in increasing order."""
+    return list(iter_bits(bits))
+
+
+def bits2set(bits, elements):
+    """Return the set of elements whose indices are set in *bits*."""
+    return set(elements[i] for i in iter_bits(bits))
+
+
+def popcount(bits):
+    """Return the number of set bits."""
+    return bin(bits).count('1')
+
+
+def full_mask(n):
+    """Return the bitset containing indices 0..n-1."""
+    return (1 << n) - 1
+
+
+def rows2bits(table):
+    """
+    Return the list of bitsets of rows of a 2-dimensional boolean array.
+    """
+    table = np.asarray(table, dtype=bool)
+    if table.shape[1] == 0:
+        return [0] * len(table)
+    packed = np.packbits(table, axis=1, bitorder='little')
+    return [int.from_bytes(row.tobytes(), 'little') for row in packed]
+
+
+def bits2packed(bits_list, n):
+    """
+    Return a 2-dimensional uint8 array whose rows are bitsets from
+    *bits_list* over *n* elements packed in little bit order, as produced by
+    numpy.packbits(..., bitorder='little').
+    """
+    nbytes = (n + 7) // 8
+    buf = b''.join(bits.to_bytes(nbytes, 'little') for bits in bits_list)
+    return np.frombuffer(buf, dtype=np.uint8).reshape(len(bits_list), nbytes)
+
+
+def packed2bits(row):
+    """Return the bitset stored in a packed uint8 row."""
+    return int.from_bytes(np.asarray(row, dtype=np.uint8).tobytes(), 'little')
+
+
+def bits2row(bits, n):
+    """Return the boolean numpy array of length *n* described by *bits*."""
+    nbytes = (n + 7) // 8
+    packed = np.frombuffer(bits.to_bytes(nbytes, 'little'), dtype=np.uint8)
+    return np.unpackbits(packed, count=n, bitorder='little').astype(bool)
+
+
+if __name__ == "__main__":
+    import doctest
+    doctest.testmod()
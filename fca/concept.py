@@ -30,31 +30,76 @@ class Concept(object):
     >>> print c
     (['Earth', 'Mars', 'Mercury', 'Venus'], ['Near to the sun', 'Small size'])
 
+    Extent and intent are stored as frozensets, the hash is computed once,
+    and the meta dictionary is only created when it is first accessed.
+    To change a concept assign a new extent or intent.
+
+    >>> c.extent = c.extent | {'Pluto'}
+    >>> 'Pluto' in c.extent
+    True
+
     """
-    # TODO: add __eq__
-    
+    __slots__ = ('_extent', '_intent', '_hash', '_meta')
+
     def __init__(self, extent, intent):
         """Initialize a concept with given extent and intent """
-        self.extent = set(extent)
-        self.intent = set(intent)
-        self.meta = {}
+        self._extent = frozenset(extent)
+        self._intent = frozenset(intent)
+        self._hash = None
+        self._meta = None
+
+    def get_extent(self):
+        return self._extent
+
+    def set_extent(self, extent):
+        self._extent = frozenset(extent)
+        self._hash = None
+
+    extent = property(get_extent, set_extent)
+
+    def get_intent(self):
+        return self._intent
+
+    def set_intent(self, intent):
+        self._intent = frozenset(intent)
+        self._hash = None
+
+    intent = property(get_intent, set_intent)
+
+    def get_meta(self):
+        if self._meta is None:
+            self._meta = {}
+        return self._meta
+
+    def set_meta(self, meta):
+        self._meta = meta
+
+    meta = property(get_meta, set_meta)
+
+    def __getstate__(self):
+        # the cached hash is not valid in another interpreter
+        return (self._extent, self._intent, self._meta)
+
+    def __setstate__(self, state):
+        self._extent, self._intent, self._meta = state
+        self._hash = None
 
     def __str__(self):
         """Return a string representation of a concept"""
-        if len(self.intent) > 0:
-            e = list(self.extent)
+        if len(self._intent) > 0:
+            e = list(self._extent)
             e.sort()
         else:
             # TODO: Sometimes |intent| > 0, but extent is G.
             e = "G"
-        if len(self.extent) > 0:
-            i = list(self.intent)
+        if len(self._extent) > 0:
+            i = list(self._intent)
             i.sort()
         else:
             # TODO: Sometimes |extent| > 0, but intent is M.
             i = "M"
-        if len(list(self.meta.keys())) != 0:
-            s = " meta: {0}".format(self.meta)
+        if self._meta:
+            s = " meta: {0}".format(self._meta)
         else:
             s = ""
         return "({0}, {1}){2}".format(e, i, s)
@@ -64,11 +109,16 @@ class Concept(object):
 
     def __eq__(self, other):
         return (type(self) == type(other) and
-                self.extent == other.extent and
-                self.intent == other.intent)
+                self._intent == other._intent and
+                self._extent == other._extent)
+
+    def __ne__(self, other):
+        return not self == other
 
     def __hash__(self):
-        return hash(str(self))
+        if self._hash is None:
+            self._hash = hash((self._extent, self._intent))
+        return self._hash
 
     def pairs(self):
         if not self.extent or not self.intent:
@@ -1,4 +1,5 @@
 from .algorithms import norris
+from .bitsets import iter_bits, set2bits, full_mask, popcount
 
 class ConceptLattice(object):
     """ConceptLattice class
@@ -29,14 +30,157 @@ class ConceptLattice(object):
     True
     >>> print cl.children(cl[6]) == set((cl[5], cl[3], cl[8]))
     True
+    >>> cl.is_subconcept(cl[1], cl[3])
+    True
+    >>> cl.parent_ids(5)
+    [6]
+    >>> print(cl.concept_of_attributes(['b']))
+    (['3', '4'], ['b', 'c'])
+    >>> print(cl.concept_of_objects(['1', '2']))
+    (['1', '2'], ['a'])
+    >>> print(cl.meet(cl[3], cl[5]))
+    (['2'], ['a', 'c'])
+    >>> print(cl.join(cl[1], cl[7]))
+    (['1', '4'], ['d'])
+
+    Concepts are identified by their positions in the lattice. The covering
+    relation is stored as adjacency lists of concept ids in both directions,
+    up-sets and down-sets are computed lazily as bitsets over concept ids.
+    Intents and extents are indexed as bitsets, so finding a concept by its
+    intent or extent takes a single hash lookup.
 
     """
     def __init__(self, context, builder=norris):
         (self._concepts, self._parents) = builder(context)
-        self._bottom_concept = [c for c in self._concepts if not self.ideal(c)][0]
-        self._top_concept = [c for c in self._concepts if not self.filter(c)][0]
         self._context = context
+        self._build_index()
+
+    def _build_index(self):
+        attribute_indices = self._context.attribute_indices
+        object_indices = self._context.object_indices
+        self._intent_bits = [set2bits(c.intent, attribute_indices)
+                             for c in self._concepts]
+        self._extent_bits = [set2bits(c.extent, object_indices)
+                             for c in self._concepts]
+        self._intent_index = dict((bits, i)
+                                  for i, bits in enumerate(self._intent_bits))
+        self._extent_index = dict((bits, i)
+                                  for i, bits in enumerate(self._extent_bits))
+        self._parent_ids = [sorted(self.index(p) for p in self._parents[c])
+                            for c in self._concepts]
+        self._children_ids = [[] for _ in self._concepts]
+        for i, parent_ids in enumerate(self._parent_ids):
+            for j in parent_ids:
+                self._children_ids[j].append(i)
+        self._top_concept = [self._concepts[i]
+                             for i, ids in enumerate(self._parent_ids)
+                             if not ids][0]
+        self._bottom_concept = [self._concepts[i]
+                                for i, ids in enumerate(self._children_ids)
+                                if not ids][0]
+        self._up_sets = None
+        self._down_sets = None
+
+    def _compute_closed_sets(self, neighbour_ids, reverse):
+        # neighbours of a concept are processed before the concept itself
+        order = sorted(range(len(self._concepts)),
+                       key=lambda i: len(self._concepts[i].intent),
+                       reverse=reverse)
+        closed_sets = [0] * len(self._concepts)
+        for i in order:
+            bits = 1 << i
+            for j in neighbour_ids[i]:
+                bits |= closed_sets[j]
+            closed_sets[i] = bits
+        return closed_sets
+
+    def up_set(self, i):
+        """
+        Return the bitset of ids of concepts greater than or equal to the
+        concept with id *i*.
+        """
+        if self._up_sets is None:
+            self._up_sets = self._compute_closed_sets(self._parent_ids, False)
+        return self._up_sets[i]
+
+    def down_set(self, i):
+        """
+        Return the bitset of ids of concepts less than or equal to the
+        concept with id *i*.
+        """
+        if self._down_sets is None:
+            self._down_sets = self._compute_closed_sets(self._children_ids,
+                                                        True)
+        return self._down_sets[i]
+
+    def parent_ids(self, i):
+        """Return the list of ids of upper neighbours of concept *i*"""
+        return self._parent_ids[i]
+
+    def children_ids(self, i):
+        """Return the list of ids of lower neighbours of concept *i*"""
+        return self._children_ids[i]
+
+    def extent_sizes(self):
+        """Return the list of extent sizes of all concepts"""
+        return [popcount(bits) for bits in self._extent_bits]
+
+    def concept_of_attributes(self, attributes):
+        """
+        Return the concept whose intent is the closure of *attributes*.
+        """
+        attribute_indices = self._context.attribute_indices
+        extent = self._context.aprime_bits(set2bits(attributes,
+                                                    attribute_indices))
+        return self._concepts[self._extent_index[extent]]
+
+    def concept_of_objects(self, objects):
+        """
+        Return the concept whose extent is the closure of *objects*.
+        """
+        object_indices = self._context.object_indices
+        intent = self._context.oprime_bits(set2bits(objects, object_indices))
+        return self._concepts[self._intent_index[intent]]
+
+    def meet(self, concept, other):
+        """Return the greatest common subconcept of two concepts"""
+        return self.meet_all((concept, other))
+
+    def join(self, concept, other):
+        """Return the least common superconcept of two concepts"""
+        return self.join_all((concept, other))
+
+    def meet_all(self, concepts):
+        """
+        Return the greatest common subconcept of *concepts*. The meet of no
+        concepts is the top concept.
+        """
+        extent = full_mask(len(self._context.objects))
+        for concept in concepts:
+            extent &= self._extent_bits[self.index(concept)]
+        # an intersection of extents is an extent
+        return self._concepts[self._extent_index[extent]]
+
+    def join_all(self, concepts):
+        """
+        Return the least common superconcept of *concepts*. The join of no
+        concepts is the bottom concept.
+        """
+        intent = full_mask(len(self._context.attributes))
+        for concept in concepts:
+            intent &= self._intent_bits[self.index(concept)]
+        # an intersection of intents is an intent
+        return self._concepts[self._intent_index[intent]]
+
+    def is_subconcept(self, concept, other):
+        """Check whether *concept* is less than or equal to *other*"""
+        return bool(self.up_set(self.index(concept)) >> self.index(other) & 1)
     
+    def pack(self):
+        """Return the lattice stored as packed bit matrices"""
+        from .packed_lattice import PackedConceptLattice
+        return PackedConceptLattice.from_lattice(self)
+
     def get_context(self):
         return self._context
     
@@ -48,23 +192,22 @@ class ConceptLattice(object):
     concepts = property(get_concepts)
     
     def get_top_concept(self):
-        # TODO: change
         return self._top_concept
     top_concept = property(get_top_concept)
 
     def get_bottom_concept(self):
-        # TODO: change
         return self._bottom_concept
 
     bottom_concept = property(get_bottom_concept)
 
     def filter(self, concept):
-        # TODO: optimize
-        return [c for c in self._concepts if concept.intent > c.intent]
+        i = self.index(concept)
+        return [self._concepts[j] for j in iter_bits(self.up_set(i) & ~(1 << i))]
 
     def ideal(self, concept):
-        # TODO: optimize
-        return [c for c in self._concepts if c.intent > concept.intent]
+        i = self.index(concept)
+        return [self._concepts[j]
+                for j in iter_bits(self.down_set(i) & ~(1 << i))]
 
     def __len__(self):
         return len(self._concepts)
@@ -73,7 +216,11 @@ class ConceptLattice(object):
         return self._concepts[key]
 
     def __contains__(self, value):
-        return value in self._concepts
+        try:
+            self.index(value)
+        except ValueError:
+            return False
+        return True
 
     def __str__(self):
         s = ""
@@ -82,13 +229,22 @@ class ConceptLattice(object):
         return s[:-1]
 
     def index(self, concept):
-        return self._concepts.index(concept)
+        try:
+            bits = set2bits(concept.intent, self._context.attribute_indices)
+            i = self._intent_index[bits]
+        except (KeyError, AttributeError):
+            raise ValueError("{0} is not in lattice".format(concept))
+        if self._concepts[i].extent != concept.extent:
+            raise ValueError("{0} is not in lattice".format(concept))
+        return i
     
     def parents(self, concept):
-        return self._parents[concept]
+        return set(self._concepts[j]
+                   for j in self._parent_ids[self.index(concept)])
 
     def children(self, concept):
-        return set([c for c in self._concepts if concept in self.parents(c)])
+        return set(self._concepts[j]
+                   for j in self._children_ids[self.index(concept)])
     
 if __name__ == "__main__":
     import doctest
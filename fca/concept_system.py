@@ -88,18 +88,8 @@ class ConceptSystem(object):
         ========
 
         """
-        cs = self
-        parents = dict([(c, set()) for c in cs])
-
-        for i in range(len(cs)):
-            for j in range(len(cs)):
-                if cs[i].intent < cs[j].intent:
-                    parents[cs[j]].add(cs[i])
-                    for k in range(len(cs)):
-                        if cs[i].intent < cs[k].intent < cs[j].intent:
-                                parents[cs[j]].remove(cs[i])
-                                break
-        return parents
+        from fca.algorithms.norris import compute_covering_relation
+        return compute_covering_relation(self)
 
     def parents(self, concept):
         if not self._parents:
@@ -8,6 +8,7 @@ import random
 from collections import Counter
 
 import fca.algorithms
+from fca.bitsets import rows2bits, iter_bits, full_mask
 
 import numpy as np
 from functools import reduce
@@ -247,6 +248,8 @@ class Context(object):
         self.object_indices = {obj: ind for ind, obj in enumerate(_objects)}
         self.attribute_indices = {att: ind
                                   for ind, att in enumerate(_attributes)}
+        self._object_bits = None
+        self._attribute_bits = None
         
     def get_table(self):
         return self.np_table
@@ -353,6 +356,28 @@ class Context(object):
         index = self.attribute_indices[a]
         return self.get_attribute_extent_by_index(index)
         
+    def get_object_bits(self):
+        """
+        Return the list of object intents as bitsets over attribute indices.
+        """
+        if self._object_bits is None:
+            self._object_bits = rows2bits(self._shaped_table())
+        return self._object_bits
+    object_bits = property(get_object_bits)
+
+    def get_attribute_bits(self):
+        """
+        Return the list of attribute extents as bitsets over object indices.
+        """
+        if self._attribute_bits is None:
+            self._attribute_bits = rows2bits(self._shaped_table().T)
+        return self._attribute_bits
+    attribute_bits = property(get_attribute_bits)
+
+    def _shaped_table(self):
+        # a context without objects stores a one-dimensional empty table
+        return self.np_table.reshape(len(self.objects), len(self.attributes))
+
     def get_value(self, o, a):
         io = self.objects.index(o)
         ia = self.attributes.index(a)
@@ -468,6 +493,38 @@ class Context(object):
     def aclosure_inds(self, att_inds):
         return self.oprime_inds(self.aprime_inds(att_inds))
     
+    def oprime_bits(self, obj_bits):
+        """
+        Compute the bitset of all attributes shared by given objects. Objects
+        are specified by a bitset over object indices.
+        """
+        object_bits = self.object_bits
+        common_intent = full_mask(len(self.attributes))
+        for i in iter_bits(obj_bits):
+            common_intent &= object_bits[i]
+            if not common_intent:
+                break
+        return common_intent
+
+    def aprime_bits(self, att_bits):
+        """
+        Compute the bitset of all objects shared by given attributes.
+        Attributes are specified by a bitset over attribute indices.
+        """
+        attribute_bits = self.attribute_bits
+        common_extent = full_mask(len(self.objects))
+        for j in iter_bits(att_bits):
+            common_extent &= attribute_bits[j]
+            if not common_extent:
+                break
+        return common_extent
+
+    def oclosure_bits(self, obj_bits):
+        return self.aprime_bits(self.oprime_bits(obj_bits))
+
+    def aclosure_bits(self, att_bits):
+        return self.oprime_bits(self.aprime_bits(att_bits))
+
     def oprime(self, objects):
         obj_inds = [self.object_indices[obj] for obj in objects]
         att_inds = self.oprime_inds(obj_inds)
@@ -2,6 +2,7 @@
 """
 Contains class for implications
 """
+from fca.bitsets import set2bits, bits2set
 
 class Implication(object):
     """
@@ -72,20 +73,28 @@ class Implication(object):
         return self.__repr__()
 
     def __eq__(self, other):
-        if ((self.premise == other.premise) and
-                (self.conclusion == other.conclusion)):
-            return 1
-        else:
-            return 0
+        if not isinstance(other, Implication):
+            return NotImplemented
+        return (self._premise == other._premise and
+                self._conclusion - self._premise ==
+                other._conclusion - other._premise)
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        if result is NotImplemented:
+            return result
+        return not result
 
     def __hash__(self):
-        return hash(str(self))
+        # premise and conclusion are mutable, so the hash is not cached
+        return hash((frozenset(self._premise),
+                     frozenset(self._conclusion - self._premise)))
             
     def is_respected(self, some_set):
         """Checks whether *some_set* respects an implication or not"""
         # if some_set contains every element from premise and not every
         # element from conclusion then it doesn't respect an implication
-        if type(some_set) == set:
+        if isinstance(some_set, (set, frozenset)):
             return not self.premise <= some_set or self.conclusion <= some_set
         else:
             # Assume a partial example
@@ -101,7 +110,130 @@ class Implication(object):
         conclusion = str2set(str_conclusion)
         return cls(premise, conclusion)
 
-        
+    def to_bits(self, attributes, indices=None):
+        """
+        Return the BitImplication equal to this one over sequence of
+        *attributes*; *indices* maps an attribute to its position.
+        """
+        return BitImplication.from_implication(self, attributes, indices)
+
+
+class BitImplication(object):
+    """
+    An immutable implication over a fixed sequence of attributes. Premise
+    and conclusion are stored as bitsets (bit *i* stands for
+    attributes[i]), the conclusion without the premise, and the hash is
+    computed once, so BitImplications are cheap to compare and to keep in
+    sets and dictionaries. Attribute sets are built only on request.
+
+    Examples
+    ========
+
+    >>> attributes = ('a', 'b', 'c')
+    >>> imp = BitImplication(0b011, 0b110, attributes)
+    >>> imp
+    a, b => c
+    >>> imp.premise_bits, imp.conclusion_bits
+    (3, 4)
+    >>> imp.premise == {'a', 'b'}
+    True
+    >>> imp.is_respected({'a', 'b'})
+    False
+    >>> imp.is_respected_bits(0b111)
+    True
+    >>> old = Implication({'a', 'b'}, {'c'})
+    >>> old.to_bits(attributes) == imp
+    True
+    >>> imp.to_implication() == old
+    True
+    """
+    __slots__ = ('premise_bits', 'conclusion_bits', 'attributes', '_hash')
+
+    def __init__(self, premise_bits, conclusion_bits, attributes):
+        """
+        Create implication from bitsets over sequence of *attributes*
+        """
+        # slots are read directly in closure loops, so they are public and
+        # made read-only by __setattr__
+        set_ = object.__setattr__
+        set_(self, 'premise_bits', premise_bits)
+        set_(self, 'conclusion_bits', conclusion_bits & ~premise_bits)
+        set_(self, 'attributes', attributes)
+        set_(self, '_hash', hash((premise_bits, self.conclusion_bits)))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("BitImplication is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("BitImplication is immutable")
+
+    def __reduce__(self):
+        return (BitImplication,
+                (self.premise_bits, self.conclusion_bits, self.attributes))
+
+    @classmethod
+    def from_implication(cls, implication, attributes, indices=None):
+        """
+        Convert *implication* (any object with get_premise and
+        get_conclusion) to a BitImplication over *attributes*
+        """
+        if indices is None:
+            indices = dict((m, i) for i, m in enumerate(attributes))
+        return cls(set2bits(implication.get_premise(), indices),
+                   set2bits(implication.get_conclusion(), indices),
+                   attributes)
+
+    def to_implication(self):
+        """Return an equal Implication with mutable attribute sets"""
+        return Implication(self.get_premise(), self.get_conclusion())
+
+    def get_premise(self):
+        """
+        Return premise of implication
+        """
+        return frozenset(bits2set(self.premise_bits, self.attributes))
+
+    def get_conclusion(self):
+        """
+        Return conclusion of implication (without the premise)
+        """
+        return frozenset(bits2set(self.conclusion_bits, self.attributes))
+
+    get_reduced_conclusion = get_conclusion
+    premise = property(get_premise)
+    conclusion = property(get_conclusion)
+
+    def __repr__(self):
+        return repr(self.to_implication())
+
+    def __eq__(self, other):
+        if not isinstance(other, BitImplication):
+            return NotImplemented
+        return (self.premise_bits == other.premise_bits and
+                self.conclusion_bits == other.conclusion_bits and
+                (self.attributes is other.attributes or
+                 tuple(self.attributes) == tuple(other.attributes)))
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        if result is NotImplemented:
+            return result
+        return not result
+
+    def __hash__(self):
+        return self._hash
+
+    def is_respected_bits(self, bits):
+        """Checks whether bitset *bits* respects an implication or not"""
+        return (self.premise_bits & ~bits != 0 or
+                self.conclusion_bits & ~bits == 0)
+
+    def is_respected(self, some_set):
+        """Checks whether *some_set* respects an implication or not"""
+        return (not self.premise <= some_set or
+                self.conclusion <= some_set)
+
+
 class UnitImplication(Implication):
     def __init__(self, premise = set(), conclusion = None):
         """
@@ -140,7 +272,7 @@ class NegativeImplication(Implication):
         """Checks whether *some_set* respects the negative implication"""
         # if some_set contains every element from premise and any
         # element from conclusion then it doesn't respect an implication
-        if type(some_set) == set:
+        if isinstance(some_set, (set, frozenset)):
             return (not self.premise <= some_set or
                     not (self.conclusion & some_set))
         else:
@@ -0,0 +1,302 @@
+# -*- coding: utf-8 -*-
+"""
+Holds ImplicationIndex, SetIndex and IndexCache classes
+"""
+import operator
+
+from fca.bitsets import set2bits, bits2set, iter_bits, full_mask, popcount
+
+
+class ImplicationIndex(object):
+    """
+    A collection of implications indexed for premise, entailment and
+    subsumption queries.
+
+    Attributes are numbered in order of appearance and implications in
+    order of addition; premises and conclusions are stored as bitsets
+    over attribute numbers. For every attribute the bitsets of numbers of
+    implications having it in the premise and in the conclusion are kept
+    (inverted lists), so e.g. implications whose premises are contained
+    in X are found with one OR over the attributes outside X instead of
+    testing every implication.
+
+    Examples
+    ========
+
+    >>> from fca.implication import Implication
+    >>> a2b = Implication({'a'}, {'b'})
+    >>> b2c = Implication({'b'}, {'c'})
+    >>> ab2c = Implication({'a', 'b'}, {'c'})
+    >>> index = ImplicationIndex([a2b, b2c, ab2c])
+    >>> index.with_premise_in({'a', 'c'})
+    [a => b]
+    >>> index.violated_by({'b', 'd'})
+    [b => c]
+    >>> index.entails({'a'}, {'c'})
+    True
+    >>> index.subsumed_by(b2c)
+    [a, b => c]
+    >>> index.discard(a2b)
+    >>> index.entails({'a'}, {'c'})
+    False
+    >>> len(index)
+    2
+    """
+    def __init__(self, implications=()):
+        self._attributes = []
+        self._indices = {}
+        self._premise_lists = []
+        self._conclusion_lists = []
+        self._implications = []
+        self._premises = []
+        self._conclusions = []
+        self._ids = {}
+        self._alive = 0
+        for imp in implications:
+            self.add(imp)
+
+    def _bits(self, attribute_set, grow=False):
+        if grow:
+            for m in attribute_set:
+                if m not in self._indices:
+                    self._indices[m] = len(self._attributes)
+                    self._attributes.append(m)
+                    self._premise_lists.append(0)
+                    self._conclusion_lists.append(0)
+            return set2bits(attribute_set, self._indices)
+        return set2bits([m for m in attribute_set if m in self._indices],
+                        self._indices)
+
+    def _unknown(self, attribute_set):
+        return any(m not in self._indices for m in attribute_set)
+
+    def add(self, implication):
+        """Add *implication* to the index"""
+        premise = self._bits(implication.get_premise(), grow=True)
+        conclusion = self._bits(implication.get_conclusion(),
+                                grow=True) & ~premise
+        i = len(self._implications)
+        bit = 1 << i
+        self._implications.append(implication)
+        self._premises.append(premise)
+        self._conclusions.append(conclusion)
+        self._ids.setdefault((premise, conclusion), []).append(i)
+        for m in iter_bits(premise):
+            self._premise_lists[m] |= bit
+        for m in iter_bits(conclusion):
+            self._conclusion_lists[m] |= bit
+        self._alive |= bit
+
+    def discard(self, implication):
+        """Remove an implication equal to *implication* if there is one"""
+        if (self._unknown(implication.get_premise()) or
+                self._unknown(implication.get_conclusion())):
+            return
+        premise = self._bits(implication.get_premise())
+        conclusion = self._bits(implication.get_conclusion()) & ~premise
+        ids = self._ids.get((premise, conclusion))
+        if ids:
+            self._alive &= ~(1 << ids.pop())
+
+    def __len__(self):
+        return popcount(self._alive)
+
+    def __iter__(self):
+        for i in iter_bits(self._alive):
+            yield self._implications[i]
+
+    def _with_premise_in(self, bits):
+        outside = 0
+        for m in iter_bits(full_mask(len(self._attributes)) & ~bits):
+            outside |= self._premise_lists[m]
+        return self._alive & ~outside
+
+    def _with_conclusion_in(self, bits):
+        outside = 0
+        for m in iter_bits(full_mask(len(self._attributes)) & ~bits):
+            outside |= self._conclusion_lists[m]
+        return self._alive & ~outside
+
+    def _with_premise_containing(self, bits):
+        ids = self._alive
+        for m in iter_bits(bits):
+            ids &= self._premise_lists[m]
+        return ids
+
+    def with_premise_in(self, attribute_set):
+        """Return implications whose premises are subsets of attribute_set"""
+        ids = self._with_premise_in(self._bits(attribute_set))
+        return [self._implications[i] for i in iter_bits(ids)]
+
+    def violated_by(self, attribute_set):
+        """Return implications not respected by *attribute_set*"""
+        bits = self._bits(attribute_set)
+        ids = self._with_premise_in(bits) & ~self._with_conclusion_in(bits)
+        return [self._implications[i] for i in iter_bits(ids)]
+
+    def respects(self, attribute_set):
+        """Check whether *attribute_set* respects all implications"""
+        bits = self._bits(attribute_set)
+        violated = (self._with_premise_in(bits) &
+                    ~self._with_conclusion_in(bits))
+        return not violated
+
+    def _close(self, bits):
+        fired = 0
+        while True:
+            new = self._with_premise_in(bits) & ~fired
+            if not new:
+                return bits
+            fired |= new
+            for i in iter_bits(new):
+                bits |= self._conclusions[i]
+
+    def closure(self, attribute_set):
+        """
+        Return the closure of *attribute_set* under the implications.
+        Attributes unknown to the index are kept as they are.
+        """
+        closed = self._close(self._bits(attribute_set))
+        return set(attribute_set) | bits2set(closed, self._attributes)
+
+    def entails(self, premise, conclusion):
+        """Check whether implication premise => conclusion follows"""
+        return set(conclusion) <= self.closure(premise)
+
+    def subsumed_by(self, implication):
+        """
+        Return other implications that follow from *implication* alone,
+        i.e. have larger premises and conclusions within the conclusion of
+        *implication* and their own premises.
+        """
+        if self._unknown(implication.get_premise()):
+            return []
+        premise = self._bits(implication.get_premise())
+        conclusion = self._bits(implication.get_conclusion()) | premise
+        ids = self._with_premise_containing(premise)
+        result = []
+        for i in iter_bits(ids):
+            imp = self._implications[i]
+            rest = self._conclusions[i] & ~(conclusion | self._premises[i])
+            if imp is not implication and not rest:
+                result.append(imp)
+        return result
+
+
+class SetIndex(object):
+    """
+    A collection of attribute sets indexed for subset queries.
+
+    Sets are stored as bitsets over attribute numbers together with
+    inverted lists of sets having each attribute, as premises in
+    ImplicationIndex, so the sets contained in X are found with one OR
+    over the attributes outside X.
+
+    Examples
+    ========
+
+    >>> index = SetIndex([{'a'}, {'b', 'c'}])
+    >>> index.subsets_of({'a', 'b'})
+    [frozenset({'a'})]
+    >>> index.has_subset_of({'b', 'd'})
+    False
+    >>> index.discard({'a'})
+    >>> len(index)
+    1
+    """
+    def __init__(self, sets=()):
+        self._attributes = []
+        self._indices = {}
+        self._lists = []
+        self._sets = []
+        self._ids = {}
+        self._alive = 0
+        for s in sets:
+            self.add(s)
+
+    def add(self, attribute_set):
+        """Add *attribute_set* to the index"""
+        for m in attribute_set:
+            if m not in self._indices:
+                self._indices[m] = len(self._attributes)
+                self._attributes.append(m)
+                self._lists.append(0)
+        bits = set2bits(attribute_set, self._indices)
+        i = len(self._sets)
+        bit = 1 << i
+        self._sets.append(frozenset(attribute_set))
+        self._ids.setdefault(bits, []).append(i)
+        for m in iter_bits(bits):
+            self._lists[m] |= bit
+        self._alive |= bit
+
+    def discard(self, attribute_set):
+        """Remove a set equal to *attribute_set* if there is one"""
+        if any(m not in self._indices for m in attribute_set):
+            return
+        ids = self._ids.get(set2bits(attribute_set, self._indices))
+        if ids:
+            self._alive &= ~(1 << ids.pop())
+
+    def __len__(self):
+        return popcount(self._alive)
+
+    def __iter__(self):
+        for i in iter_bits(self._alive):
+            yield self._sets[i]
+
+    def _subsets_of(self, attribute_set):
+        bits = set2bits([m for m in attribute_set if m in self._indices],
+                        self._indices)
+        outside = 0
+        for m in iter_bits(full_mask(len(self._attributes)) & ~bits):
+            outside |= self._lists[m]
+        return self._alive & ~outside
+
+    def subsets_of(self, attribute_set):
+        """Return stored sets that are subsets of *attribute_set*"""
+        ids = self._subsets_of(attribute_set)
+        return [self._sets[i] for i in iter_bits(ids)]
+
+    def has_subset_of(self, attribute_set):
+        """Check whether some stored set is a subset of *attribute_set*"""
+        return bool(self._subsets_of(attribute_set))
+
+
+class IndexCache(object):
+    """
+    Keeps an index built by *factory* (e.g. ImplicationIndex or SetIndex)
+    in sync with a list of items that its owner may change in any way.
+
+    get(items) compares *items* with the items indexed so far by identity:
+    items appended at the end are added to the index, any other change
+    (replacement, removal, reordering) rebuilds it. Changes of the items
+    themselves are not detected.
+
+    Examples
+    ========
+
+    >>> patterns = [{'a'}]
+    >>> cache = IndexCache(SetIndex)
+    >>> cache.get(patterns).has_subset_of({'a', 'b'})
+    True
+    >>> patterns[0] = {'c'}
+    >>> cache.get(patterns).has_subset_of({'a', 'b'})
+    False
+    """
+    def __init__(self, factory):
+        self._factory = factory
+        self._items = []
+        self._index = factory()
+
+    def get(self, items):
+        """Return the index of *items*"""
+        n = len(self._items)
+        if len(items) >= n and all(map(operator.is_, self._items, items)):
+            for item in items[n:]:
+                self._index.add(item)
+            self._items.extend(items[n:])
+        else:
+            self._index = self._factory(items)
+            self._items = list(items)
+        return self._index
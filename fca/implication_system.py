@@ -0,0 +1,197 @@
+# -*- coding: utf-8 -*-
+"""
+Holds ImplicationSystem class
+"""
+import numpy as np
+
+from fca.bitsets import (set2bits, bits2set, iter_bits, popcount, rows2bits,
+                         bits2packed)
+from fca.implication import BitImplication
+
+
+class ImplicationSystem(object):
+    """
+    A set of implications compiled for fast closure computation.
+
+    Attributes are numbered by their positions in *attributes* (by default
+    in order of appearance in *implications*), premises and conclusions are
+    stored as bitsets, and for every attribute the list of implications
+    having it in the premise is kept. Closures are computed with LinClosure
+    in time linear in the total size of premises. Many sets can be closed
+    at once with close_many, which works on boolean matrices of premises,
+    conclusions and candidate sets.
+
+    Examples
+    ========
+
+    >>> from fca.implication import Implication
+    >>> a2bc = Implication(set(('a')), set(('b', 'c')))
+    >>> ce2abd = Implication(set(('c', 'e')), set(('a', 'b', 'd')))
+    >>> imps = ImplicationSystem([a2bc, ce2abd], ['a', 'b', 'c', 'd', 'e'])
+    >>> imps.closure(set(['a', 'e'])) == set(['a', 'b', 'c', 'd', 'e'])
+    True
+    >>> imps.closure(set(['b', 'f'])) == set(['b', 'f'])
+    True
+    >>> imps.close(0b1)
+    7
+    >>> imps.close_many([0b1, 0b10, 0b10100])
+    [7, 2, 31]
+    >>> len(imps)
+    2
+    """
+    def __init__(self, implications=(), attributes=None):
+        implications = list(implications)
+        if attributes is None:
+            attributes = []
+            seen = set()
+            for imp in implications:
+                for a in list(imp.get_premise()) + list(imp.get_conclusion()):
+                    if a not in seen:
+                        seen.add(a)
+                        attributes.append(a)
+        self._attributes = list(attributes)
+        self._indices = dict((a, i) for i, a in enumerate(self._attributes))
+        self._premises = []
+        self._conclusions = []
+        self._premise_sizes = []
+        self._index = [[] for _ in self._attributes]
+        self._no_premise = []
+        self._matrices = None
+        for imp in implications:
+            self.add(imp)
+
+    def get_attributes(self):
+        return self._attributes
+
+    attributes = property(get_attributes)
+
+    def add(self, implication):
+        """
+        Add *implication*; its attributes must be known to the system.
+        A BitImplication over the same attributes is added without
+        converting its sets.
+        """
+        if (isinstance(implication, BitImplication) and
+                (implication.attributes is self._attributes or
+                 list(implication.attributes) == self._attributes)):
+            self.add_bits(implication.premise_bits,
+                          implication.conclusion_bits)
+            return
+        self.add_bits(set2bits(implication.get_premise(), self._indices),
+                      set2bits(implication.get_conclusion(), self._indices))
+
+    def add_bits(self, premise, conclusion):
+        """Add implication given by bitsets *premise* and *conclusion*"""
+        i = len(self._premises)
+        self._matrices = None
+        self._premises.append(premise)
+        self._conclusions.append(conclusion)
+        self._premise_sizes.append(popcount(premise))
+        if premise:
+            for m in iter_bits(premise):
+                self._index[m].append(i)
+        else:
+            self._no_premise.append(i)
+
+    def get_bits(self, i):
+        """Return the pair of bitsets (premise, conclusion) of implication *i*"""
+        return (self._premises[i], self._conclusions[i])
+
+    def set_bits(self, i, premise, conclusion):
+        """
+        Replace implication *i* by the one given by bitsets *premise* and
+        *conclusion*. Setting both to 0 effectively removes the implication
+        without changing indices of the others.
+        """
+        self._matrices = None
+        old_premise = self._premises[i]
+        if old_premise:
+            for m in iter_bits(old_premise):
+                self._index[m].remove(i)
+        else:
+            self._no_premise.remove(i)
+        self._premises[i] = premise
+        self._conclusions[i] = conclusion
+        self._premise_sizes[i] = popcount(premise)
+        if premise:
+            for m in iter_bits(premise):
+                self._index[m].append(i)
+        else:
+            self._no_premise.append(i)
+
+    def __len__(self):
+        return len(self._premises)
+
+    def close(self, bits):
+        """Return the closure of bitset *bits* (LinClosure)"""
+        conclusions = self._conclusions
+        index = self._index
+        count = self._premise_sizes[:]
+        closed = bits
+        for i in self._no_premise:
+            closed |= conclusions[i]
+        update = list(iter_bits(closed))
+        while update:
+            m = update.pop()
+            for i in index[m]:
+                count[i] -= 1
+                if not count[i]:
+                    new = conclusions[i] & ~closed
+                    if new:
+                        closed |= new
+                        update.extend(iter_bits(new))
+        return closed
+
+    def _to_matrix(self, bits_list):
+        n = len(self._attributes)
+        packed = bits2packed(bits_list, n)
+        return np.unpackbits(packed, axis=1, count=n,
+                             bitorder='little').astype(bool)
+
+    def _get_matrices(self):
+        if self._matrices is None:
+            premises = self._to_matrix(self._premises).astype(np.float64)
+            conclusions = self._to_matrix(self._conclusions).astype(np.float64)
+            sizes = np.array(self._premise_sizes, dtype=np.float64)
+            self._matrices = (premises.T, conclusions, sizes)
+        return self._matrices
+
+    def close_many(self, bits_list):
+        """
+        Return the list of closures of bitsets from *bits_list*.
+
+        All sets are closed simultaneously: on every round the matrix of
+        candidate sets is multiplied by the matrix of premises to find
+        implications whose premises are contained in each set, their
+        conclusions are added, and rounds are repeated until no set
+        changes.
+        """
+        if not bits_list:
+            return []
+        if not self._premises:
+            return list(bits_list)
+        premises_t, conclusions, sizes = self._get_matrices()
+        sets = self._to_matrix(bits_list)
+        active = np.arange(len(sets))
+        while len(active):
+            current = sets[active]
+            fired = current.astype(np.float64).dot(premises_t) == sizes
+            new = current | (fired.astype(np.float64).dot(conclusions) > 0)
+            changed = (new != current).any(axis=1)
+            sets[active] = new
+            active = active[changed]
+        return rows2bits(sets)
+
+    def closure(self, attribute_set):
+        """
+        Return the closure of a set of attributes. Attributes unknown to
+        the system are kept as they are.
+        """
+        known = [a for a in attribute_set if a in self._indices]
+        closed = self.close(set2bits(known, self._indices))
+        return set(attribute_set) | bits2set(closed, self._attributes)
+
+
+if __name__ == "__main__":
+    import doctest
+    doctest.testmod()
@@ -0,0 +1,408 @@
+# -*- coding: utf-8 -*-
+"""Holds PackedConceptLattice class"""
+
+import numbers
+
+import numpy as np
+
+from .algorithms import norris
+from .bitsets import set2bits, bits2packed, packed2bits
+from .concept import Concept
+
+
+class PackedConceptLattice(object):
+    """Concept lattice stored column-wise
+
+    All intents form one packed |L| x |M| bit matrix, all extents one packed
+    |L| x |G| bit matrix (rows as produced by
+    numpy.packbits(..., bitorder='little')), and the covering relation is
+    stored as CSR adjacency arrays: the parents of concept *i* are
+    parent_idx[parent_ptr[i]:parent_ptr[i + 1]].
+
+    Meta values of concepts are stored by key. A key whose values are all
+    floats is stored as a float column (NaN where a value is missing), a
+    key that every concept has with an int value as an int64 column. Values
+    of other keys (strings, bools, mixed types, ints missing for some
+    concepts) are kept as they are in the side mapping extra_meta from
+    concept ids to meta dictionaries, so unpacked concepts get exactly the
+    meta values that were packed.
+
+    Concept objects are not stored, they are created on access, hence
+    memory consumption does not depend on the number of Python objects and
+    queries over the whole lattice are vectorised.
+
+    Examples
+    ========
+
+    >>> from fca import Context, ConceptLattice
+    >>> ct = [[True, False, False, True],\
+              [True, False, True, False],\
+              [False, True, True, False],\
+              [False, True, True, True]]
+    >>> objs = ['1', '2', '3', '4']
+    >>> attrs = ['a', 'b', 'c', 'd']
+    >>> c = Context(ct, objs, attrs)
+    >>> pcl = PackedConceptLattice(c)
+    >>> len(pcl)
+    9
+    >>> print(pcl[4])
+    (['3', '4'], ['b', 'c'])
+    >>> pcl.ids_with_attributes(['c']).tolist()
+    [0, 2, 4, 5, 7]
+    >>> pcl.parent_ids(5).tolist()
+    [6]
+    >>> ConceptLattice(c).pack()[4] == pcl[4]
+    True
+    >>> cl = ConceptLattice(c)
+    >>> for concept in cl:
+    ...     concept.meta['size'] = len(concept.extent)
+    >>> cl[4].meta['label'] = 'bc'
+    >>> packed = cl.pack()
+    >>> packed.meta['size'].dtype
+    dtype('int64')
+    >>> packed.extra_meta
+    {4: {'label': 'bc'}}
+    >>> packed[4].meta == {'size': 2, 'label': 'bc'}
+    True
+
+    """
+    def __init__(self, context, builder=norris):
+        (concepts, parents) = builder(context)
+        ids = dict((c, i) for i, c in enumerate(concepts))
+        self._pack(context, concepts,
+                   [sorted(ids[p] for p in parents[c]) for c in concepts])
+
+    @classmethod
+    def from_lattice(cls, lattice):
+        """Pack concepts and covering relation of a ConceptLattice"""
+        packed = cls.__new__(cls)
+        concepts = lattice.concepts
+        packed._pack(lattice.context, concepts,
+                     [lattice.parent_ids(i) for i in range(len(concepts))])
+        return packed
+
+    @classmethod
+    def from_arrays(cls, context, intents, extents, parent_ptr, parent_idx,
+                    meta=None, children_ptr=None, children_idx=None,
+                    extra_meta=None):
+        """Create a lattice from packed intents, extents and CSR arrays"""
+        packed = cls.__new__(cls)
+        packed._set_arrays(context, intents, extents, parent_ptr, parent_idx,
+                           meta, extra_meta)
+        if children_ptr is not None:
+            packed._children_ptr = children_ptr
+            packed._children_idx = children_idx
+        return packed
+
+    def _pack(self, context, concepts, parent_lists):
+        attribute_indices = context.attribute_indices
+        object_indices = context.object_indices
+        intents = bits2packed([set2bits(c.intent, attribute_indices)
+                               for c in concepts], len(context.attributes))
+        extents = bits2packed([set2bits(c.extent, object_indices)
+                               for c in concepts], len(context.objects))
+        parent_ptr = np.zeros(len(concepts) + 1, dtype=np.int64)
+        parent_ptr[1:] = np.cumsum([len(ps) for ps in parent_lists])
+        parent_idx = np.fromiter((j for ps in parent_lists for j in ps),
+                                 dtype=np.int64, count=int(parent_ptr[-1]))
+        meta, extra_meta = _pack_meta([c.meta for c in concepts])
+        self._set_arrays(context, intents, extents, parent_ptr, parent_idx,
+                         meta, extra_meta)
+
+    def _set_arrays(self, context, intents, extents, parent_ptr, parent_idx,
+                    meta, extra_meta=None):
+        self._context = context
+        self._intents = intents
+        self._extents = extents
+        self._parent_ptr = parent_ptr
+        self._parent_idx = parent_idx
+        self._meta = meta if meta is not None else {}
+        self._extra_meta = extra_meta if extra_meta is not None else {}
+        self._children_ptr = None
+        self._children_idx = None
+        self._intent_index = None
+        self._extent_index = None
+
+    def get_context(self):
+        return self._context
+
+    context = property(get_context)
+
+    def get_intents(self):
+        """Return the packed |L| x |M| matrix of intents"""
+        return self._intents
+
+    intents = property(get_intents)
+
+    def get_extents(self):
+        """Return the packed |L| x |G| matrix of extents"""
+        return self._extents
+
+    extents = property(get_extents)
+
+    def get_meta(self):
+        """Return the dictionary of meta columns"""
+        return self._meta
+
+    meta = property(get_meta)
+
+    def get_extra_meta(self):
+        """Return the dictionary of meta values not stored in columns"""
+        return self._extra_meta
+
+    extra_meta = property(get_extra_meta)
+
+    def get_top_concept(self):
+        return self[int(np.argmax(self.extent_sizes()))]
+
+    top_concept = property(get_top_concept)
+
+    def get_bottom_concept(self):
+        return self[int(np.argmax(self.intent_sizes()))]
+
+    bottom_concept = property(get_bottom_concept)
+
+    def _unpack(self, row, elements):
+        inds = np.nonzero(np.unpackbits(row, count=len(elements),
+                                        bitorder='little'))[0]
+        return [elements[j] for j in inds]
+
+    def _make_concept(self, i):
+        concept = Concept(self._unpack(self._extents[i],
+                                       self._context.objects),
+                          self._unpack(self._intents[i],
+                                       self._context.attributes))
+        for key, column in self._meta.items():
+            if column.dtype.kind in 'iu':
+                concept.meta[key] = int(column[i])
+            elif not np.isnan(column[i]):
+                concept.meta[key] = float(column[i])
+        if i in self._extra_meta:
+            concept.meta.update(self._extra_meta[i])
+        return concept
+
+    def _pack_attributes(self, attributes):
+        bits = set2bits(attributes, self._context.attribute_indices)
+        return bits2packed([bits], len(self._context.attributes))[0]
+
+    def _pack_objects(self, objects):
+        bits = set2bits(objects, self._context.object_indices)
+        return bits2packed([bits], len(self._context.objects))[0]
+
+    def intent_sizes(self):
+        """Return the array of intent sizes of all concepts"""
+        return np.unpackbits(self._intents, axis=1).sum(axis=1)
+
+    def extent_sizes(self):
+        """Return the array of extent sizes of all concepts"""
+        return np.unpackbits(self._extents, axis=1).sum(axis=1)
+
+    def ids_with_attributes(self, attributes):
+        """Return ids of all concepts whose intents contain *attributes*"""
+        mask = self._pack_attributes(attributes)
+        return np.nonzero(np.all((self._intents & mask) == mask, axis=1))[0]
+
+    def ids_with_objects(self, objects):
+        """Return ids of all concepts whose extents contain *objects*"""
+        mask = self._pack_objects(objects)
+        return np.nonzero(np.all((self._extents & mask) == mask, axis=1))[0]
+
+    def _ids_with_intent_in(self, mask):
+        return np.nonzero(np.all((self._intents & ~mask) == 0, axis=1))[0]
+
+    def get_parent_csr(self):
+        """Return the pair (parent_ptr, parent_idx)"""
+        return (self._parent_ptr, self._parent_idx)
+
+    parent_csr = property(get_parent_csr)
+
+    def get_children_csr(self):
+        """Return the pair (children_ptr, children_idx)"""
+        if self._children_ptr is None:
+            self._compute_children()
+        return (self._children_ptr, self._children_idx)
+
+    children_csr = property(get_children_csr)
+
+    def parent_ids(self, i):
+        """Return the array of ids of upper neighbours of concept *i*"""
+        return self._parent_idx[self._parent_ptr[i]:self._parent_ptr[i + 1]]
+
+    def children_ids(self, i):
+        """Return the array of ids of lower neighbours of concept *i*"""
+        if self._children_ptr is None:
+            self._compute_children()
+        return self._children_idx[self._children_ptr[i]:
+                                  self._children_ptr[i + 1]]
+
+    def _compute_children(self):
+        n = len(self)
+        degrees = np.diff(self._parent_ptr)
+        children = np.repeat(np.arange(n, dtype=np.int64), degrees)
+        order = np.argsort(self._parent_idx, kind='stable')
+        self._children_idx = children[order]
+        self._children_ptr = np.zeros(n + 1, dtype=np.int64)
+        self._children_ptr[1:] = np.cumsum(
+            np.bincount(self._parent_idx, minlength=n))
+
+    def parents(self, concept):
+        return set(self[j] for j in self.parent_ids(self.index(concept)))
+
+    def children(self, concept):
+        return set(self[j] for j in self.children_ids(self.index(concept)))
+
+    def filter(self, concept):
+        i = self.index(concept)
+        return [self[j] for j in self._ids_with_intent_in(self._intents[i])
+                if j != i]
+
+    def ideal(self, concept):
+        i = self.index(concept)
+        return [self[j] for j in self.ids_with_attributes(concept.intent)
+                if j != i]
+
+    def meet(self, concept, other):
+        """Return the greatest common subconcept of two concepts"""
+        return self.meet_all((concept, other))
+
+    def join(self, concept, other):
+        """Return the least common superconcept of two concepts"""
+        return self.join_all((concept, other))
+
+    def meet_all(self, concepts):
+        """
+        Return the greatest common subconcept of *concepts*. The meet of no
+        concepts is the top concept.
+        """
+        ids = [self.index(c) for c in concepts]
+        if not ids:
+            return self.top_concept
+        extent = np.bitwise_and.reduce(self._extents[ids], axis=0)
+        return self[self._id_by_extent_bits(packed2bits(extent))]
+
+    def join_all(self, concepts):
+        """
+        Return the least common superconcept of *concepts*. The join of no
+        concepts is the bottom concept.
+        """
+        ids = [self.index(c) for c in concepts]
+        if not ids:
+            return self.bottom_concept
+        intent = np.bitwise_and.reduce(self._intents[ids], axis=0)
+        return self[self._id_by_intent_bits(packed2bits(intent))]
+
+    def is_subconcept(self, concept, other):
+        """Check whether *concept* is less than or equal to *other*"""
+        intent = self._intents[self.index(concept)]
+        other_intent = self._intents[self.index(other)]
+        return bool(np.all((other_intent & ~intent) == 0))
+
+    def _id_by_intent_bits(self, bits):
+        if self._intent_index is None:
+            self._intent_index = dict((packed2bits(row), i)
+                                      for i, row in enumerate(self._intents))
+        return self._intent_index[bits]
+
+    def _id_by_extent_bits(self, bits):
+        if self._extent_index is None:
+            self._extent_index = dict((packed2bits(row), i)
+                                      for i, row in enumerate(self._extents))
+        return self._extent_index[bits]
+
+    def concept_of_attributes(self, attributes):
+        """
+        Return the concept whose intent is the closure of *attributes*.
+        """
+        attribute_indices = self._context.attribute_indices
+        extent = self._context.aprime_bits(set2bits(attributes,
+                                                    attribute_indices))
+        return self[self._id_by_extent_bits(extent)]
+
+    def concept_of_objects(self, objects):
+        """
+        Return the concept whose extent is the closure of *objects*.
+        """
+        object_indices = self._context.object_indices
+        intent = self._context.oprime_bits(set2bits(objects, object_indices))
+        return self[self._id_by_intent_bits(intent)]
+
+    def index(self, concept):
+        try:
+            bits = set2bits(concept.intent, self._context.attribute_indices)
+            i = self._id_by_intent_bits(bits)
+            extent_bits = set2bits(concept.extent,
+                                   self._context.object_indices)
+        except (KeyError, AttributeError):
+            raise ValueError("{0} is not in lattice".format(concept))
+        if packed2bits(self._extents[i]) != extent_bits:
+            raise ValueError("{0} is not in lattice".format(concept))
+        return i
+
+    def __len__(self):
+        return len(self._intents)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return [self._make_concept(i) for i in range(len(self))[key]]
+        if key < 0:
+            key += len(self)
+        if not 0 <= key < len(self):
+            raise IndexError("concept index out of range")
+        return self._make_concept(key)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self._make_concept(i)
+
+    def __contains__(self, value):
+        try:
+            self.index(value)
+        except ValueError:
+            return False
+        return True
+
+    def __str__(self):
+        return "\n".join(str(c) for c in self)
+
+
+def _is_float(value):
+    return (isinstance(value, numbers.Real) and
+            not isinstance(value, numbers.Integral) and value == value)
+
+
+def _is_int(value):
+    return (isinstance(value, numbers.Integral) and
+            not isinstance(value, bool) and -2 ** 63 <= value < 2 ** 63)
+
+
+def _pack_meta(metas):
+    """
+    Split meta dictionaries *metas* of concepts into the dictionary of
+    float and int64 columns and the side mapping from concept ids to the
+    other meta values.
+    """
+    values = {}
+    for i, meta in enumerate(metas):
+        for key, value in meta.items():
+            values.setdefault(key, []).append((i, value))
+    columns = {}
+    extra_meta = {}
+    for key, pairs in values.items():
+        if all(_is_float(value) for _, value in pairs):
+            column = np.full(len(metas), np.nan)
+            for i, value in pairs:
+                column[i] = value
+            columns[key] = column
+        elif (len(pairs) == len(metas) and
+                all(_is_int(value) for _, value in pairs)):
+            columns[key] = np.array([value for _, value in pairs],
+                                    dtype=np.int64)
+        else:
+            for i, value in pairs:
+                extra_meta.setdefault(i, {})[key] = value
+    return columns, extra_meta
+
+
+if __name__ == "__main__":
+    import doctest
+    doctest.testmod()
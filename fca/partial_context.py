@@ -3,7 +3,7 @@
 import fca.algorithms
 from fca import Context
 from fca.algorithms.closure_operators import aprime, oprime
-from fca.algorithms.closure_operators import simple_closure as closure
+from fca.implication_system import ImplicationSystem
 from .compare_context import subseteq_table
 from fca.algorithms.dg_basis import compute_partial_dg_basis
 from copy import copy, deepcopy
@@ -96,9 +96,10 @@ class PartialContext(object):
         self.objects.append(name)
         
     def complete(self, implications):
+        closure = ImplicationSystem(implications).closure
         for o in self.objects:
             xintent = self.x_context.get_object_intent(o)
-            new_xintent = closure(xintent, implications)
+            new_xintent = closure(xintent)
             qintent = self.q_context.get_object_intent(o)
             if not new_xintent <= qintent:
                 # TODO: undo the modifications
@@ -107,8 +108,7 @@ class PartialContext(object):
             self.x_context.set_object_intent(new_xintent, o)
             new_qintent = set([a for a in qintent
                                  if a in new_xintent or
-                                 closure(new_xintent | {a}, implications)
-                                                                    <= qintent
+                                 closure(new_xintent | {a}) <= qintent
                              ])
             self.q_context.set_object_intent(new_qintent, o)
             # TODO: Remove printing
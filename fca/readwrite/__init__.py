@@ -7,3 +7,4 @@ from fca.readwrite.cxt import *
 from fca.readwrite.dot import *
 from fca.readwrite.xml_ import *
 from fca.readwrite.fimi import *
+from fca.readwrite.binary import *
@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+"""Holds functions that write and read concept lattices in binary format"""
+
+import json
+import os
+
+import numpy as np
+
+import fca
+from fca.packed_lattice import PackedConceptLattice
+
+FORMAT_VERSION = 2
+
+
+def write_binary(lattice, path):
+    """Write concept lattice to directory *path* in binary format
+
+    Every array of a PackedConceptLattice (packed intents and extents,
+    parents and children CSR arrays, meta columns) as well as the packed
+    cross table of the context is written to a separate .npy file, names of
+    objects, attributes and meta columns as well as meta values not stored
+    in columns (PackedConceptLattice.extra_meta) are written to names.json.
+    Hence the lattice can be opened with memory mapping by read_binary.
+
+    Object and attribute names, meta keys and meta values not stored in
+    columns must be read back from JSON unchanged (strings, ints, floats,
+    bools, None and lists and string-keyed dictionaries of them),
+    otherwise ValueError is raised before anything is written.
+
+    *lattice* is a ConceptLattice or a PackedConceptLattice.
+    """
+    if not isinstance(lattice, PackedConceptLattice):
+        lattice = lattice.pack()
+    cxt = lattice.context
+    _check_json(cxt.objects, 'Object name')
+    _check_json(cxt.attributes, 'Attribute name')
+    _check_json(lattice.meta.keys(), 'Meta key')
+    extra_meta = [[i, key, value]
+                  for i, meta in sorted(lattice.extra_meta.items())
+                  for key, value in meta.items()]
+    _check_json([key for _, key, _ in extra_meta], 'Meta key')
+    _check_json([value for _, _, value in extra_meta], 'Meta value')
+    if not os.path.isdir(path):
+        os.makedirs(path)
+    parent_ptr, parent_idx = lattice.parent_csr
+    children_ptr, children_idx = lattice.children_csr
+    arrays = {'table': np.packbits(cxt._shaped_table(), axis=1,
+                                   bitorder='little'),
+              'intents': lattice.intents,
+              'extents': lattice.extents,
+              'parent_ptr': parent_ptr,
+              'parent_idx': parent_idx,
+              'children_ptr': children_ptr,
+              'children_idx': children_idx}
+    meta_keys = sorted(lattice.meta.keys(), key=str)
+    for i, key in enumerate(meta_keys):
+        arrays['meta{0}'.format(i)] = lattice.meta[key]
+    for name, array in arrays.items():
+        np.save(os.path.join(path, name + '.npy'), np.asarray(array))
+    names = {'version': FORMAT_VERSION,
+             'objects': cxt.objects,
+             'attributes': cxt.attributes,
+             'meta': meta_keys,
+             'extra_meta': extra_meta}
+    with open(os.path.join(path, 'names.json'), 'w') as f:
+        json.dump(names, f)
+
+
+def read_binary(path, mmap_mode=None):
+    """Read concept lattice written by write_binary from directory *path*
+
+    Returns a PackedConceptLattice. If *mmap_mode* is given (see
+    numpy.load), arrays of the lattice are memory-mapped instead of being
+    read into memory, so even large lattices are opened immediately.
+    """
+    with open(os.path.join(path, 'names.json')) as f:
+        names = json.load(f)
+    if names['version'] not in (1, FORMAT_VERSION):
+        raise ValueError("Unsupported format version: {0}".format(
+            names['version']))
+
+    def load(name):
+        return np.load(os.path.join(path, name + '.npy'), mmap_mode=mmap_mode)
+
+    objects = names['objects']
+    attributes = names['attributes']
+    table = np.unpackbits(load('table'), axis=1, count=len(attributes),
+                          bitorder='little').astype(bool)
+    cxt = fca.Context(table.reshape(len(objects), len(attributes)),
+                      objects, attributes)
+    meta = dict((key, load('meta{0}'.format(i)))
+                for i, key in enumerate(names['meta']))
+    extra_meta = {}
+    for i, key, value in names.get('extra_meta', []):
+        extra_meta.setdefault(i, {})[key] = value
+    return PackedConceptLattice.from_arrays(cxt,
+                                            load('intents'),
+                                            load('extents'),
+                                            load('parent_ptr'),
+                                            load('parent_idx'),
+                                            meta,
+                                            load('children_ptr'),
+                                            load('children_idx'),
+                                            extra_meta)
+
+
+def _check_json(values, what):
+    """
+    Raise ValueError if some of *values* would not be read back from JSON
+    unchanged.
+    """
+    for value in values:
+        try:
+            restored = json.loads(json.dumps(value))
+        except (TypeError, ValueError):
+            restored = None
+            same = False
+        else:
+            same = _same_json(value, restored)
+        if not same:
+            raise ValueError("{0} {1!r} cannot be stored in JSON "
+                             "unchanged".format(what, value))
+
+
+def _same_json(value, restored):
+    if type(value) is not type(restored):
+        return False
+    if isinstance(value, list):
+        return (len(value) == len(restored) and
+                all(_same_json(v, r) for v, r in zip(value, restored)))
+    if isinstance(value, dict):
+        return (value.keys() == restored.keys() and
+                all(_same_json(value[k], restored[k]) for k in value))
+    return value == restored
@@ -5,6 +5,9 @@ Created on Dec 17, 2013
 
 @author: artreven
 """
+import itertools
+import unittest
+
 import fca
 import fca.algorithms
 
@@ -30,4 +33,42 @@ class Test:
             for j in range(12):
                 attr_set = {'m' + str(i), 'm' + str(j)}
                 assert (fca.algorithms.lin_closure(attr_set, aibasis) ==
-                        fca.algorithms.lin_closure(attr_set, ncbasis))
\ No newline at end of file
+                        fca.algorithms.lin_closure(attr_set, ncbasis))
+
+class IncrementalBasisTest(unittest.TestCase):
+    def setUp(self):
+        self.cxt = fca.make_random_context(40, 10, 0.35)
+
+    def test_add_attribute(self):
+        ib = fca.algorithms.aibasis.IncrementalBasis(self.cxt.objects)
+        for j, m in enumerate(self.cxt.attributes):
+            ib.add_attribute(self.cxt.get_attribute_extent_by_index(j), m)
+            sub_cxt = fca.Context(self.cxt._shaped_table()[:, :j + 1],
+                                  self.cxt.objects,
+                                  self.cxt.attributes[:j + 1])
+            # The attribute-incremental algorithm sometimes keeps an
+            # implication that is not in the Duquenne-Guigues basis (e.g.
+            # m1, m3, m4, m5, m6 => m8 with random.seed(75)), so the bases
+            # are compared by the closures they induce.
+            system = fca.ImplicationSystem(ib.implications,
+                                           sub_cxt.attributes)
+            for r in range(j + 2):
+                for s in itertools.combinations(sub_cxt.attributes, r):
+                    self.assertEqual(
+                        system.closure(set(s)),
+                        set(fca.algorithms.aclosure(set(s), sub_cxt)))
+
+    def test_kclosure(self):
+        for k in range(len(self.cxt.attributes) + 1):
+            for m in self.cxt.attributes[:k]:
+                sub_cxt = fca.Context(self.cxt._shaped_table()[:, :k],
+                                      self.cxt.objects,
+                                      self.cxt.attributes[:k])
+                self.assertEqual(
+                    fca.algorithms.aibasis.kclosure({m}, k, self.cxt),
+                    set(fca.algorithms.aclosure({m}, sub_cxt)))
+
+    def test_duplicate_attribute(self):
+        ib = fca.algorithms.aibasis.IncrementalBasis(self.cxt.objects)
+        ib.add_attribute(set(), 'x')
+        self.assertRaises(ValueError, ib.add_attribute, set(), 'x')
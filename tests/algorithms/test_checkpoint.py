@@ -0,0 +1,52 @@
+"""
+Created on Oct 19, 2026
+"""
+import itertools
+import os
+import shutil
+import tempfile
+import unittest
+
+import fca
+from fca.algorithms.dg_basis import dg_basis_iter_simple
+from fca.algorithms.norris import iterative_norris
+
+
+class TestCheckpoint(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.dir, 'state')
+        self.cxt = fca.make_random_context(30, 10, 0.35)
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def test_resume_dg_basis(self):
+        basis = list(dg_basis_iter_simple(self.cxt))
+        interrupted = dg_basis_iter_simple(self.cxt, checkpoint=self.path,
+                                           checkpoint_every=5)
+        list(itertools.islice(interrupted, len(basis) // 2))
+        resumed = list(dg_basis_iter_simple(self.cxt, resume_from=self.path))
+        self.assertEqual(resumed, basis)
+
+    def test_resume_finished_dg_basis(self):
+        basis = list(dg_basis_iter_simple(self.cxt, checkpoint=self.path))
+        resumed = list(dg_basis_iter_simple(self.cxt, resume_from=self.path))
+        self.assertEqual(resumed, basis)
+
+    def test_resume_norris(self):
+        concepts = list(iterative_norris(self.cxt))
+        interrupted = iterative_norris(self.cxt, checkpoint=self.path,
+                                       checkpoint_every=3)
+        list(itertools.islice(interrupted, len(concepts) // 2))
+        resumed = list(iterative_norris(self.cxt, resume_from=self.path))
+        self.assertEqual(resumed, concepts)
+
+    def test_wrong_checkpoint(self):
+        list(iterative_norris(self.cxt, checkpoint=self.path))
+        with self.assertRaises(ValueError):
+            list(dg_basis_iter_simple(self.cxt, resume_from=self.path))
+
+
+if __name__ == '__main__':
+    unittest.main()
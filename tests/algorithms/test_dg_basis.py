@@ -4,7 +4,8 @@
 import unittest
 from fca.algorithms import closure_operators
 import fca
-from fca import compute_dg_basis
+from fca import (compute_dg_basis, compute_dg_basis_bits,
+                 compute_dg_basis_parallel)
 from fca.implication import Implication
 
 
@@ -123,7 +124,46 @@ class BasisTest2(unittest.TestCase):
             self.assertEqual(counter, 1, message.format(imp1))
 
         
-        
+
+
+class BitsBasisTest(BasisTest):
+    def test_same_as_compute_dg_basis(self):
+        self.assertEqual(compute_dg_basis_bits(self.cxt),
+                         compute_dg_basis(self.cxt))
+
+    def test_relative_basis(self):
+        imp_basis = [Implication({'Canada'}, {'United States'})]
+        self.assertEqual(compute_dg_basis_bits(self.cxt, imp_basis=imp_basis),
+                         compute_dg_basis(self.cxt, imp_basis=imp_basis))
+
+    def test_random_contexts(self):
+        for _ in range(10):
+            cxt = fca.make_random_context(12, 8, 0.4)
+            self.assertEqual(compute_dg_basis_bits(cxt),
+                             compute_dg_basis(cxt))
+
+
+class ParallelBasisTest(BasisTest):
+    def test_same_as_compute_dg_basis(self):
+        self.assertEqual(compute_dg_basis_parallel(self.cxt, chunk_size=2),
+                         compute_dg_basis(self.cxt))
+
+    def test_relative_basis(self):
+        imp_basis = [Implication({'Canada'}, {'United States'})]
+        self.assertEqual(
+            compute_dg_basis_parallel(self.cxt, imp_basis=imp_basis),
+            compute_dg_basis(self.cxt, imp_basis=imp_basis))
+
+    def test_cond(self):
+        cxt = fca.make_random_context(30, 10, 0.3)
+        cond = lambda premise: not {'m0', 'm1'} <= premise
+        self.assertEqual(compute_dg_basis_parallel(cxt, cond=cond),
+                         compute_dg_basis(cxt, cond=cond))
+
+    def test_pool(self):
+        cxt = fca.make_random_context(30, 10, 0.3)
+        basis = compute_dg_basis_parallel(cxt, processes=2, chunk_size=4)
+        self.assertEqual(basis, compute_dg_basis(cxt))
 
 
 if __name__ == '__main__':
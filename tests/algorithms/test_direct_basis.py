@@ -0,0 +1,39 @@
+"""
+Created on Oct 19, 2026
+"""
+import itertools
+import unittest
+
+import fca
+from fca.algorithms import closure_operators
+
+
+class DirectBasisTest(unittest.TestCase):
+    def setUp(self):
+        self.cxt = fca.make_random_context(30, 8, 0.4)
+
+    def test_single_scan_closure(self):
+        basis = fca.compute_direct_basis(self.cxt)
+        for r in range(len(self.cxt.attributes) + 1):
+            for s in itertools.combinations(self.cxt.attributes, r):
+                self.assertEqual(
+                    closure_operators.direct_closure(set(s), basis),
+                    set(closure_operators.aclosure(set(s), self.cxt)))
+
+    def test_minimal_premises(self):
+        basis = fca.compute_direct_basis(self.cxt)
+        for imp in basis:
+            for m in imp.conclusion:
+                for a in imp.premise:
+                    smaller = imp.premise - {a}
+                    self.assertNotIn(
+                        m, closure_operators.aclosure(smaller, self.cxt))
+
+    def test_from_implications(self):
+        dg_basis = fca.compute_dg_basis(self.cxt)
+        self.assertEqual(fca.direct_basis(dg_basis, self.cxt.attributes),
+                         fca.compute_direct_basis(self.cxt))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,43 @@
+"""
+Created on Oct 19, 2026
+"""
+import itertools
+import unittest
+
+import fca
+
+
+class GeneratorsTest(unittest.TestCase):
+    def setUp(self):
+        self.cxt = fca.make_random_context(30, 8, 0.4)
+
+    def _closure(self, attributes):
+        return frozenset(self.cxt.aclosure(attributes))
+
+    def test_minimal_generators(self):
+        expected = {}
+        for r in range(len(self.cxt.attributes) + 1):
+            for s in itertools.combinations(self.cxt.attributes, r):
+                closed = self._closure(s)
+                if all(self._closure(set(s) - {m}) != closed for m in s):
+                    expected.setdefault(closed, set()).add(frozenset(s))
+        generators = fca.minimal_generators(self.cxt)
+        self.assertEqual(dict((intent, set(gs))
+                              for intent, gs in generators.items()),
+                         expected)
+
+    def test_support_pruning(self):
+        num_objs = len(self.cxt.objects)
+        generators = fca.minimal_generators(self.cxt)
+        frequent = fca.minimal_generators(self.cxt, min_support=0.2)
+        expected = dict((intent, gs) for intent, gs in generators.items()
+                        if len(self.cxt.aprime(intent)) >= 0.2 * num_objs)
+        self.assertEqual(frequent, expected)
+
+    def test_proper_premise_basis(self):
+        self.assertEqual(fca.proper_premise_basis(self.cxt),
+                         fca.compute_direct_basis(self.cxt))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+"""
+Created on Oct 19, 2026
+"""
+import itertools
+import random
+import unittest
+
+import fca
+from fca.algorithms import closure_operators
+from fca.algorithms.implication_covers import (minimum_cover, minimize,
+                                               compute_implication_cover,
+                                               updated_basis,
+                                               ImplicationCover)
+
+
+class MinimumCoverTest(unittest.TestCase):
+    def setUp(self):
+        self.cxt = fca.make_random_context(30, 8, 0.4)
+        self.dg_basis = fca.compute_dg_basis(self.cxt)
+        self.imps = fca.compute_direct_basis(self.cxt) + self.dg_basis
+        random.shuffle(self.imps)
+
+    def assertEquivalent(self, imps, other_imps):
+        for r in range(len(self.cxt.attributes) + 1):
+            for s in itertools.combinations(self.cxt.attributes, r):
+                self.assertEqual(closure_operators.lin_closure(set(s), imps),
+                                 closure_operators.lin_closure(set(s),
+                                                               other_imps))
+
+    def test_minimum_cover_is_dg_basis(self):
+        cover = minimum_cover(self.imps)
+        self.assertEqual(len(cover), len(self.dg_basis))
+        self.assertEqual(set(cover), set(self.dg_basis))
+
+    def test_reduced_cover(self):
+        cover = minimum_cover(self.imps, reduce_left=True, reduce_right=True)
+        self.assertEqual(len(cover), len(self.dg_basis))
+        self.assertEquivalent(cover, self.dg_basis)
+        for imp in cover:
+            rest = [i for i in cover if i is not imp]
+            for m in imp.premise:
+                self.assertFalse(imp.conclusion <= closure_operators.lin_closure(
+                    imp.premise - {m}, cover))
+            for m in imp.conclusion:
+                self.assertNotIn(m, closure_operators.lin_closure(
+                    imp.premise, rest + [fca.Implication(
+                        imp.premise, imp.conclusion - {m})]))
+
+    def test_input_not_changed(self):
+        before = [(set(i.get_premise()), set(i.get_conclusion()))
+                  for i in self.imps]
+        minimum_cover(self.imps, reduce_left=True, reduce_right=True)
+        self.assertEqual(before, [(i.get_premise(), i.get_conclusion())
+                                  for i in self.imps])
+
+    def test_minimize(self):
+        cover = self.imps[:]
+        minimize(cover)
+        self.assertEqual(set(cover), set(self.dg_basis))
+
+
+class ImplicationCoverTest(unittest.TestCase):
+    def setUp(self):
+        self.cxt = fca.make_random_context(30, 8, 0.4)
+
+    def test_cover(self):
+        cover = compute_implication_cover(self.cxt)
+        for r in range(len(self.cxt.attributes) + 1):
+            for s in itertools.combinations(self.cxt.attributes, r):
+                self.assertEqual(
+                    closure_operators.lin_closure(set(s), cover),
+                    set(closure_operators.aclosure(set(s), self.cxt)))
+
+    def test_same_as_updated_basis(self):
+        attributes = set(self.cxt.attributes)
+        basis = [fca.Implication(set(), attributes)]
+        cover = ImplicationCover(self.cxt.attributes)
+        for intent in self.cxt.examples():
+            basis = updated_basis(intent, basis, attributes)
+            cover.update(intent)
+            self.assertEqual(len(cover), len(basis))
+            self.assertEqual(set(cover.implications), set(basis))
+
+
+if __name__ == '__main__':
+    unittest.main()
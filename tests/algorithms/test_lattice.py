@@ -1,5 +1,10 @@
 import fca
+import multiprocessing
 import os
+import random
+import unittest
+
+from fca.algorithms.external_cbo import _Frontier
 
 class TestNorris:
     def setUp(self):
@@ -12,3 +17,221 @@ class TestNorris:
         assert fca.Concept(self.small_cxt.objects, []) in cl
         assert fca.Concept([], self.small_cxt.attributes) in cl
         assert len(cl) > 2
+
+
+def _naive_covering_relation(cs):
+    parents = dict([(c, set()) for c in cs])
+    for i in range(len(cs)):
+        for j in range(len(cs)):
+            if cs[i].intent < cs[j].intent:
+                parents[cs[j]].add(cs[i])
+                for k in range(len(cs)):
+                    if cs[i].intent < cs[k].intent < cs[j].intent:
+                        parents[cs[j]].remove(cs[i])
+                        break
+    return parents
+
+
+class TestCoveringRelation(unittest.TestCase):
+    def setUp(self):
+        self.cxt = fca.make_random_context(25, 10, 0.4)
+
+    def test_covering_relation(self):
+        cs = fca.norris(self.cxt, False)
+        self.assertEqual(fca.compute_covering_relation(cs),
+                         _naive_covering_relation(cs))
+
+    def test_concept_system_covering_relation(self):
+        cs = fca.ConceptSystem(fca.norris(self.cxt, False)[::2])
+        self.assertEqual(cs.compute_covering_relation(),
+                         _naive_covering_relation(cs))
+
+    def test_lindig(self):
+        cs, parents = fca.lindig(self.cxt)
+        self.assertEqual(set(cs), set(fca.norris(self.cxt, False)))
+        self.assertEqual(parents, _naive_covering_relation(cs))
+
+
+class TestLatticeNavigation(unittest.TestCase):
+    def setUp(self):
+        self.cxt = fca.make_random_context(25, 10, 0.4)
+        self.cl = fca.ConceptLattice(self.cxt)
+
+    def test_top_and_bottom(self):
+        self.assertEqual(self.cl.top_concept.extent, set(self.cxt.objects))
+        self.assertEqual(self.cl.bottom_concept.intent,
+                         set(self.cxt.attributes))
+
+    def test_filter_and_ideal(self):
+        for concept in self.cl:
+            self.assertEqual(
+                set(self.cl.filter(concept)),
+                set(c for c in self.cl if concept.intent > c.intent))
+            self.assertEqual(
+                set(self.cl.ideal(concept)),
+                set(c for c in self.cl if c.intent > concept.intent))
+
+    def test_children(self):
+        for concept in self.cl:
+            self.assertEqual(
+                self.cl.children(concept),
+                set(c for c in self.cl if concept in self.cl.parents(c)))
+
+    def test_is_subconcept(self):
+        for c1 in self.cl:
+            for c2 in self.cl:
+                self.assertEqual(self.cl.is_subconcept(c1, c2),
+                                 c1.extent <= c2.extent)
+
+
+class TestConceptLookup(unittest.TestCase):
+    def setUp(self):
+        self.cxt = fca.make_random_context(25, 10, 0.4)
+        self.cl = fca.ConceptLattice(self.cxt)
+
+    def test_index(self):
+        for i, concept in enumerate(self.cl):
+            self.assertEqual(self.cl.index(concept), i)
+            self.assertTrue(fca.Concept(concept.extent, concept.intent)
+                            in self.cl)
+        wrong = fca.Concept([], self.cl.top_concept.intent)
+        if self.cl.top_concept.extent:
+            self.assertFalse(wrong in self.cl)
+            self.assertRaises(ValueError, self.cl.index, wrong)
+
+    def test_concept_of_attributes(self):
+        for i in range(len(self.cxt.attributes)):
+            attrs = self.cxt.attributes[i:i + 2]
+            concept = self.cl.concept_of_attributes(attrs)
+            self.assertEqual(concept.intent, self.cxt.aclosure(attrs))
+
+    def test_concept_of_objects(self):
+        for i in range(len(self.cxt.objects)):
+            objs = self.cxt.objects[i:i + 2]
+            concept = self.cl.concept_of_objects(objs)
+            self.assertEqual(concept.extent, self.cxt.oclosure(objs))
+
+
+class TestMeetJoin(unittest.TestCase):
+    def setUp(self):
+        self.cxt = fca.make_random_context(25, 10, 0.4)
+        self.cl = fca.ConceptLattice(self.cxt)
+
+    def test_meet_and_join(self):
+        for c1 in self.cl:
+            for c2 in self.cl:
+                meet = self.cl.meet(c1, c2)
+                self.assertEqual(meet.extent, c1.extent & c2.extent)
+                join = self.cl.join(c1, c2)
+                self.assertEqual(join.intent, c1.intent & c2.intent)
+
+    def test_meet_all_and_join_all(self):
+        self.assertEqual(self.cl.meet_all([]), self.cl.top_concept)
+        self.assertEqual(self.cl.join_all([]), self.cl.bottom_concept)
+        concepts = self.cl[1:4]
+        self.assertEqual(self.cl.meet_all(concepts),
+                         self.cl.meet(self.cl.meet(*concepts[:2]),
+                                      concepts[2]))
+        self.assertEqual(self.cl.join_all(concepts),
+                         self.cl.join(self.cl.join(*concepts[:2]),
+                                      concepts[2]))
+
+
+class TestAOCPoset(unittest.TestCase):
+    def test_aoc_poset(self):
+        cxt = fca.make_random_context(25, 10, 0.4)
+        cl = fca.ConceptLattice(cxt)
+        aoc = fca.algorithms.aoc_poset(cxt, block_size=4)
+        expected = set(cl.concept_of_objects([g]) for g in cxt.objects)
+        expected |= set(cl.concept_of_attributes([m])
+                        for m in cxt.attributes)
+        self.assertEqual(set(aoc), expected)
+        self.assertEqual(len(aoc), len(expected))
+        for c in aoc:
+            self.assertEqual(aoc.parents(c),
+                             _naive_covering_relation(aoc)[c])
+
+
+class TestExternalCbO(unittest.TestCase):
+    def test_external_cbo(self):
+        cxt = fca.make_random_context(25, 10, 0.4)
+        concepts = []
+        n = fca.algorithms.external_cbo(cxt, concepts.append, max_frontier=3)
+        self.assertEqual(n, len(concepts))
+        self.assertEqual(len(set(concepts)), len(concepts))
+        self.assertEqual(set(concepts), set(fca.norris(cxt, False)))
+
+    def test_frontier_fan_in(self):
+        frontier = _Frontier(4, 3, None, fan_in=4)
+        records = [random.getrandbits(32).to_bytes(4, 'big')
+                   for _ in range(200)]
+        for record in records:
+            frontier.append(record)
+        self.assertEqual(list(frontier), sorted(records))
+        self.assertEqual(os.listdir(frontier._dir), [])
+
+    def test_external_cbo_with_implications(self):
+        cxt = fca.make_random_context(25, 10, 0.4)
+        imps = [fca.Implication({'m0'}, {'m1'}),
+                fca.Implication({'m2', 'm3'}, {'m4'}),
+                fca.Implication(set(), {'m5'})]
+        concepts = []
+        fca.algorithms.external_cbo(cxt, concepts.append, max_frontier=3,
+                                    implications=imps)
+        expected = [c for c in fca.norris(cxt, False)
+                    if all(imp.is_respected(c.intent) for imp in imps)]
+        self.assertEqual(len(concepts), len(expected))
+        self.assertEqual(set(concepts), set(expected))
+
+
+class TestPartitionMerge(unittest.TestCase):
+    def setUp(self):
+        self.cxt = fca.make_random_context(25, 10, 0.4)
+
+    def test_partition_merge(self):
+        shards = fca.algorithms.split_context(self.cxt, 3)
+        self.assertEqual(len(shards), 3)
+        cs, parents = fca.algorithms.partition_merge(shards)
+        self.assertEqual(set(cs), set(fca.norris(self.cxt, False)))
+        self.assertEqual(parents, fca.compute_covering_relation(cs))
+
+    def test_partition_merge_pool(self):
+        shards = fca.algorithms.split_context(self.cxt, 5)
+        with multiprocessing.Pool(2) as pool:
+            cs = fca.algorithms.partition_merge(shards, pool=pool,
+                                                with_parents=False)
+        self.assertEqual(set(cs), set(fca.norris(self.cxt, False)))
+
+
+class TestAssociationRules(unittest.TestCase):
+    def setUp(self):
+        self.cxt = fca.make_random_context(40, 10, 0.4)
+        self.cl = fca.ConceptLattice(self.cxt)
+
+    def check_rules(self, rules, min_support, min_conf):
+        checked = fca.check_implications(self.cxt, [r[0] for r in rules])
+        for (imp, support, conf), (support2, conf2, _) in zip(rules, checked):
+            self.assertAlmostEqual(support, support2)
+            self.assertAlmostEqual(conf, conf2)
+            self.assertGreaterEqual(support, min_support)
+            self.assertGreaterEqual(conf, min_conf)
+            self.assertLess(conf, 1)
+
+    def test_luxenburger_basis(self):
+        rules = list(fca.luxenburger_basis(self.cl, 0.1, 0.3))
+        self.check_rules(rules, 0.1, 0.3)
+        edges = sum(len(self.cl.parent_ids(i)) for i in range(len(self.cl)))
+        self.assertEqual(len(list(fca.luxenburger_basis(self.cl))), edges)
+
+    def test_association_rules(self):
+        rules = list(fca.association_rules(self.cl, 0.1, 0.3))
+        self.check_rules(rules, 0.1, 0.3)
+        expected = 0
+        for c in self.cl:
+            for d in self.cl.filter(c):
+                if (len(c.extent) >= 0.1 * 40 and
+                        len(c.extent) >= 0.3 * len(d.extent)):
+                    expected += 1
+        self.assertEqual(len(rules), expected)
+        packed_rules = list(fca.association_rules(self.cl.pack(), 0.1, 0.3))
+        self.assertEqual([r[0] for r in packed_rules], [r[0] for r in rules])
@@ -0,0 +1,55 @@
+"""
+Created on Oct 19, 2026
+"""
+import shutil
+import tempfile
+import unittest
+
+import fca
+
+
+class TestBinary(unittest.TestCase):
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        self.cxt = fca.make_random_context(25, 10, 0.4)
+        self.cl = fca.ConceptLattice(self.cxt)
+        self.cl[0].meta['index'] = 0.5
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+    def check_lattice(self, pcl):
+        self.assertEqual(pcl.context, self.cxt)
+        self.assertEqual(list(pcl), self.cl.concepts)
+        self.assertEqual(pcl[0].meta, {'index': 0.5})
+        for i, concept in enumerate(self.cl):
+            self.assertEqual(pcl.parents(concept), self.cl.parents(concept))
+            self.assertEqual(pcl.children(concept), self.cl.children(concept))
+
+    def test_write_read(self):
+        fca.write_binary(self.cl, self.path)
+        self.check_lattice(fca.read_binary(self.path))
+
+    def test_read_mmap(self):
+        fca.write_binary(self.cl.pack(), self.path)
+        self.check_lattice(fca.read_binary(self.path, mmap_mode='r'))
+
+    def test_meta(self):
+        for i, concept in enumerate(self.cl):
+            concept.meta['id'] = i
+        self.cl[1].meta['label'] = 'one'
+        self.cl[2].meta['tags'] = ['a', 'b']
+        fca.write_binary(self.cl, self.path)
+        pcl = fca.read_binary(self.path, mmap_mode='r')
+        for i, concept in enumerate(self.cl):
+            self.assertEqual(pcl[i].meta, concept.meta)
+            self.assertIs(type(pcl[i].meta['id']), int)
+
+    def test_unserializable(self):
+        self.cl[1].meta['pair'] = (1, 2)
+        self.assertRaises(ValueError, fca.write_binary, self.cl, self.path)
+        cxt = fca.Context(self.cxt._shaped_table(),
+                          [(i,) for i in range(len(self.cxt.objects))],
+                          self.cxt.attributes)
+        self.assertRaises(ValueError, fca.write_binary,
+                          fca.ConceptLattice(cxt), self.path)
@@ -0,0 +1,31 @@
+"""
+Created on Oct 19, 2026
+"""
+import pickle
+
+import fca
+
+
+def test_concept_hash():
+    c1 = fca.Concept([1, 2], ['a'])
+    c2 = fca.Concept({2, 1}, {'a'})
+    assert c1 == c2
+    assert hash(c1) == hash(c2)
+    c1.meta['stability'] = 0.5
+    assert hash(c1) == hash(c2)
+    assert len({c1, c2}) == 1
+
+
+def test_concept_change():
+    c = fca.Concept([1, 2], ['a'])
+    c.extent = c.extent | {3}
+    assert c == fca.Concept([1, 2, 3], ['a'])
+    assert c != fca.Concept([1, 2], ['a'])
+
+
+def test_concept_pickle():
+    c = fca.Concept([1, 2], ['a'])
+    c.meta = {'stability': 0.5}
+    c_copy = pickle.loads(pickle.dumps(c))
+    assert c_copy == c
+    assert c_copy.meta == c.meta
@@ -5,9 +5,76 @@ Created on May 22, 2014
 
 @author: artreven
 """
+import copy
+import pickle
+
 import fca
 
 def test_unit_implication():
     imp = fca.Implication({1, 2, 3}, {4})
     uimp = fca.UnitImplication(imp.premise, imp.conclusion.pop())
     assert uimp == imp
+
+def test_check_implications():
+    cxt = fca.make_random_context(50, 8, 0.4)
+    imps = cxt.get_attribute_implications()
+    imps.append(fca.Implication({'m0'}, {'m1', 'm2'}))
+    examples = list(cxt.examples())
+    for imp, (support, confidence, violators) in zip(
+            imps, fca.check_implications(cxt, imps, batch_size=3)):
+        expected = [i for i, ex in enumerate(examples)
+                    if not imp.is_respected(ex)]
+        assert violators.tolist() == expected
+        with_premise = [ex for ex in examples if imp.premise <= ex]
+        respected = len(with_premise) - len(expected)
+        assert support == respected / len(examples)
+        if with_premise:
+            assert confidence == respected / len(with_premise)
+
+def test_check_implications_iterator():
+    cxt = fca.make_random_context(30, 8, 0.4)
+    imps = cxt.get_attribute_implications()
+    checked = fca.check_implications(cxt, iter(imps), batch_size=2)
+    assert len(checked) == len(imps)
+    expected = fca.check_implications(cxt, imps)
+    assert [(s, c, v.tolist()) for s, c, v in checked] == \
+        [(s, c, v.tolist()) for s, c, v in expected]
+
+def test_bit_implication():
+    cxt = fca.make_random_context(30, 8, 0.4)
+    attributes = tuple(cxt.attributes)
+    imps = cxt.get_attribute_implications()
+    bit_imps = [imp.to_bits(attributes) for imp in imps]
+    assert len(set(bit_imps)) == len(set(imps)) == len(imps)
+    for imp, bit_imp in zip(imps, bit_imps):
+        assert bit_imp.to_implication() == imp
+        assert hash(bit_imp.to_implication()) == hash(imp)
+        assert bit_imp.premise == imp.premise
+        assert bit_imp.conclusion == imp.conclusion
+        assert str(bit_imp) == str(imp)
+        for ex in cxt.examples():
+            assert bit_imp.is_respected(ex) == imp.is_respected(ex)
+            bits = fca.bitsets.set2bits(ex, cxt.attribute_indices)
+            assert bit_imp.is_respected_bits(bits) == imp.is_respected(ex)
+    assert bit_imps[0] != imps[0]
+
+def test_implication_equality():
+    imp = fca.Implication({'a'}, {'a', 'b'})
+    assert imp == fca.Implication({'a'}, {'b'})
+    assert not imp != fca.Implication({'a'}, {'b'})
+    assert hash(imp) == hash(fca.Implication({'a'}, {'b'}))
+    assert imp != fca.Implication({'a'}, {'c'})
+    assert imp != 'a => b'
+
+def test_bit_implication_immutable():
+    imp = fca.BitImplication(0b011, 0b111, ('a', 'b', 'c'))
+    assert imp.conclusion_bits == 0b100
+    for name in ('premise_bits', 'conclusion_bits', 'attributes'):
+        try:
+            setattr(imp, name, 0)
+        except AttributeError:
+            pass
+        else:
+            assert False, name
+    assert pickle.loads(pickle.dumps(imp)) == imp
+    assert copy.deepcopy(imp) == imp
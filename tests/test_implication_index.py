@@ -0,0 +1,103 @@
+"""
+Created on Oct 19, 2026
+"""
+import random
+
+import fca
+from fca.algorithms import closure_operators
+from fca.algorithms.implication_covers import is_subsumed
+from tests.test_implication_system import random_implications
+
+
+def test_queries():
+    attributes = ['m' + str(i) for i in range(12)]
+    imps = random_implications(attributes, 40)
+    index = fca.ImplicationIndex(imps)
+    assert len(index) == len(imps)
+    for _ in range(50):
+        s = set(random.sample(attributes, random.randint(0, 6)))
+        assert index.with_premise_in(s) == [imp for imp in imps
+                                            if imp.premise <= s]
+        assert index.violated_by(s) == [imp for imp in imps
+                                        if not imp.is_respected(s)]
+        assert index.respects(s) == all(imp.is_respected(s) for imp in imps)
+        closure = closure_operators.simple_closure(s, imps)
+        assert index.closure(s) == closure
+        m = random.choice(attributes)
+        assert index.entails(s, {m}) == (m in closure)
+    for imp in imps:
+        expected = [other for other in imps
+                    if other is not imp and is_subsumed(other, imp)]
+        assert index.subsumed_by(imp) == expected
+
+
+def test_discard():
+    attributes = ['m' + str(i) for i in range(8)]
+    imps = random_implications(attributes, 20)
+    index = fca.ImplicationIndex(imps)
+    for imp in imps[:10]:
+        index.discard(imp)
+    index.discard(fca.Implication({'unknown'}, {'m0'}))
+    assert len(index) == 10
+    s = set(random.sample(attributes, 4))
+    assert index.closure(s) == closure_operators.simple_closure(s, imps[10:])
+
+
+def test_discard_unknown_conclusion():
+    a2b = fca.Implication({'a'}, {'b'})
+    index = fca.ImplicationIndex([a2b])
+    index.discard(fca.Implication({'a'}, {'b', 'x'}))
+    assert list(index) == [a2b]
+    index.discard(fca.Implication({'a'}, {'a', 'b'}))
+    assert len(index) == 0
+
+
+def test_set_index():
+    attributes = ['m' + str(i) for i in range(8)]
+    sets = [frozenset(random.sample(attributes, random.randint(0, 4)))
+            for _ in range(30)]
+    index = fca.SetIndex(sets)
+    for s in sets[:10]:
+        index.discard(s)
+    index.discard({'unknown'})
+    rest = sets[10:]
+    assert sorted(map(sorted, index)) == sorted(map(sorted, rest))
+    for _ in range(30):
+        x = set(random.sample(attributes, random.randint(0, 6))) | {'x'}
+        expected = [s for s in rest if s <= x]
+        assert sorted(map(sorted, index.subsets_of(x))) == \
+            sorted(map(sorted, expected))
+        assert index.has_subset_of(x) == bool(expected)
+
+
+def test_index_cache():
+    attributes = ['m' + str(i) for i in range(8)]
+    imps = random_implications(attributes, 10)
+    cache = fca.IndexCache(fca.ImplicationIndex)
+    for change in range(4):
+        if change == 1:
+            imps.extend(random_implications(attributes, 3))
+        elif change == 2:
+            imps[0] = fca.Implication(set(), set(attributes))
+        elif change == 3:
+            del imps[0]
+            imps.append(fca.Implication({'m0'}, {'m1'}))
+        index = cache.get(imps)
+        assert len(index) == len(imps)
+        for _ in range(10):
+            s = set(random.sample(attributes, 3))
+            assert index.closure(s) == \
+                closure_operators.simple_closure(s, imps)
+
+
+def test_exploration_index():
+    cxt = fca.make_random_context(15, 6, 0.4)
+    exploration = fca.algorithms.exploration.BasicExploration(cxt)
+    assert exploration.check_intent_for_conflicts(set(cxt.attributes))
+    exploration.confirmed_attribute_implications.append(
+        fca.Implication({'m0'}, {'m1'}))
+    assert not exploration.check_intent_for_conflicts({'m0'})
+    exploration.confirmed_attribute_implications[0] = \
+        fca.Implication({'m2'}, {'m1'})
+    assert exploration.check_intent_for_conflicts({'m0'})
+    assert not exploration.check_intent_for_conflicts({'m2'})
@@ -0,0 +1,67 @@
+"""
+Created on Oct 19, 2026
+"""
+import random
+
+import fca
+import fca.bitsets
+from fca.algorithms import closure_operators
+
+
+def random_implications(attributes, n):
+    imps = []
+    for _ in range(n):
+        premise = set(random.sample(attributes, random.randint(0, 3)))
+        conclusion = set(random.sample(attributes, random.randint(1, 3)))
+        imps.append(fca.Implication(premise, conclusion))
+    return imps
+
+
+def test_closure():
+    attributes = ['m' + str(i) for i in range(12)]
+    imps = random_implications(attributes, 15)
+    imp_system = fca.ImplicationSystem(imps, attributes)
+    for _ in range(50):
+        s = set(random.sample(attributes, random.randint(0, 4)))
+        expected = closure_operators.simple_closure(s, imps)
+        assert imp_system.closure(s) == expected
+        assert closure_operators.lin_closure(s, imps) == expected
+
+
+def test_close_many():
+    attributes = ['m' + str(i) for i in range(12)]
+    imps = random_implications(attributes, 15)
+    imp_system = fca.ImplicationSystem(imps, attributes)
+    sets = [set(random.sample(attributes, random.randint(0, 4)))
+            for _ in range(50)]
+    indices = dict((a, i) for i, a in enumerate(attributes))
+    bits_list = [fca.bitsets.set2bits(s, indices) for s in sets]
+    assert (imp_system.close_many(bits_list) ==
+            [imp_system.close(bits) for bits in bits_list])
+
+
+def test_from_iterator():
+    attributes = ['m' + str(i) for i in range(12)]
+    imps = random_implications(attributes, 15)
+    imp_system = fca.ImplicationSystem(iter(imps))
+    assert len(imp_system) == len(imps)
+    s = set(random.sample(attributes, 3))
+    assert imp_system.closure(s) == closure_operators.simple_closure(s, imps)
+
+
+def test_bit_implications():
+    attributes = ['m' + str(i) for i in range(12)]
+    imps = random_implications(attributes, 15)
+    indices = dict((a, i) for i, a in enumerate(attributes))
+    bit_imps = closure_operators.implications_to_bits(imps, indices)
+    imp_system = fca.ImplicationSystem(bit_imps, attributes)
+    for _ in range(50):
+        s = set(random.sample(attributes, random.randint(0, 4)))
+        expected = closure_operators.simple_closure(s, imps)
+        bits = fca.bitsets.set2bits(s, indices)
+        assert imp_system.closure(s) == expected
+        assert (closure_operators.bits_closure(bits, bit_imps) ==
+                closure_operators.bits_direct_closure(
+                    bits, closure_operators.implications_to_bits(
+                        fca.direct_basis(imps, attributes), indices)) ==
+                fca.bitsets.set2bits(expected, indices))
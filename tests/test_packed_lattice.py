@@ -0,0 +1,74 @@
+"""
+Created on Oct 19, 2026
+"""
+import unittest
+
+import fca
+
+
+class TestPackedLattice(unittest.TestCase):
+    def setUp(self):
+        self.cxt = fca.make_random_context(25, 10, 0.4)
+        self.cl = fca.ConceptLattice(self.cxt)
+        self.pcl = self.cl.pack()
+
+    def test_concepts(self):
+        self.assertEqual(len(self.pcl), len(self.cl))
+        self.assertEqual(list(self.pcl), self.cl.concepts)
+        self.assertEqual(self.pcl.top_concept, self.cl.top_concept)
+        self.assertEqual(self.pcl.bottom_concept, self.cl.bottom_concept)
+
+    def test_navigation(self):
+        for i, concept in enumerate(self.cl):
+            self.assertEqual(self.pcl.index(concept), i)
+            self.assertEqual(self.pcl.parents(concept),
+                             self.cl.parents(concept))
+            self.assertEqual(self.pcl.children(concept),
+                             self.cl.children(concept))
+            self.assertEqual(set(self.pcl.filter(concept)),
+                             set(self.cl.filter(concept)))
+            self.assertEqual(set(self.pcl.ideal(concept)),
+                             set(self.cl.ideal(concept)))
+
+    def test_unknown_elements(self):
+        top = self.pcl.top_concept
+        with_object = fca.Concept(top.extent | {'unknown'}, top.intent)
+        with_attribute = fca.Concept(top.extent, top.intent | {'unknown'})
+        for concept in (with_object, with_attribute):
+            self.assertNotIn(concept, self.pcl)
+            self.assertRaises(ValueError, self.pcl.index, concept)
+
+    def test_ids_with_attributes(self):
+        attrs = self.cxt.attributes[:2]
+        ids = self.pcl.ids_with_attributes(attrs)
+        self.assertEqual(set(self.cl[i] for i in ids),
+                         set(c for c in self.cl if set(attrs) <= c.intent))
+
+    def test_meta(self):
+        self.cl[0].meta['index'] = 0.5
+        pcl = self.cl.pack()
+        self.assertEqual(pcl[0].meta, {'index': 0.5})
+        self.assertEqual(pcl[1].meta, {})
+
+    def test_meta_types(self):
+        for i, concept in enumerate(self.cl):
+            concept.meta['id'] = i
+        self.cl[0].meta['index'] = 0.5
+        self.cl[0].meta['label'] = 'top'
+        self.cl[1].meta['count'] = 3
+        self.cl[2].meta['flag'] = True
+        pcl = self.cl.pack()
+        self.assertEqual(sorted(pcl.meta), ['id', 'index'])
+        self.assertEqual(sorted(pcl.extra_meta), [0, 1, 2])
+        for i, concept in enumerate(self.cl):
+            self.assertEqual(pcl[i].meta, concept.meta)
+            for key, value in pcl[i].meta.items():
+                self.assertIs(type(value), type(concept.meta[key]))
+
+    def test_meet_and_join(self):
+        for c1 in self.cl[::3]:
+            for c2 in self.cl[::2]:
+                self.assertEqual(self.pcl.meet(c1, c2), self.cl.meet(c1, c2))
+                self.assertEqual(self.pcl.join(c1, c2), self.cl.join(c1, c2))
+        self.assertEqual(self.pcl.meet_all([]), self.cl.top_concept)
+        self.assertEqual(self.pcl.join_all([]), self.cl.bottom_concept)